@@ -1,9 +1,19 @@
 """Create placeholder backchannel audio files (no API key required)."""
 import numpy as np
-import wave
+import struct
 from pathlib import Path
 
 
+def wav_header(data_len: int, sample_rate: int = 16000) -> bytes:
+    """Build a 44-byte RIFF header for mono 16-bit PCM."""
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_len, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', data_len
+    )
+
+
 def create_placeholder_backchannels():
     """Create simple tone-based placeholder backchannels."""
     
@@ -23,6 +33,11 @@ def create_placeholder_backchannels():
     sample_rate = 16000
     duration = 0.3  # 300ms
     
+    # Shared time axis and fade ramp (identical for every tone)
+    t = np.arange(int(sample_rate * duration), dtype=np.float32) / sample_rate
+    fade_samples = int(sample_rate * 0.05)  # 50ms fade
+    fade_in = np.linspace(0, 1, fade_samples, dtype=np.float32)
+    
     for i, name in enumerate(backchannels):
         output_path = backchannel_dir / f"{name}.wav"
         
@@ -32,28 +47,18 @@ def create_placeholder_backchannels():
         
         # Create a simple tone (different frequency for each)
         frequency = 440 + (i * 50)  # A4, then higher
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        
-        # Generate tone with envelope to avoid clicks
-        tone = np.sin(2 * np.pi * frequency * t)
-        
-        # Apply fade in/out envelope
-        envelope = np.ones_like(tone)
-        fade_samples = int(sample_rate * 0.05)  # 50ms fade
-        envelope[:fade_samples] = np.linspace(0, 1, fade_samples)
-        envelope[-fade_samples:] = np.linspace(1, 0, fade_samples)
+        tone = np.sin(np.float32(2 * np.pi * frequency) * t)
         
-        tone = tone * envelope
+        # Apply fade in/out envelope in place to avoid clicks
+        tone[:fade_samples] *= fade_in
+        tone[-fade_samples:] *= fade_in[::-1]
         
         # Convert to int16
-        audio_int16 = (tone * 16000).astype(np.int16)
+        np.multiply(tone, 16000, out=tone)
+        audio_int16 = tone.astype(np.int16)
         
-        # Write WAV file
-        with wave.open(str(output_path), 'w') as wav_file:
-            wav_file.setnchannels(1)  # mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
+        # Write WAV file (fixed mono/16-bit format, header written directly)
+        output_path.write_bytes(wav_header(audio_int16.nbytes, sample_rate) + audio_int16.tobytes())
         
         print(f"✅ Created: {name}.wav ({frequency}Hz tone)")
     
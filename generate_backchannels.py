@@ -41,33 +41,34 @@ async def generate_backchannels():
     print("🎙️  Generating backchannel audio files...")
     print("=" * 60)
     
-    for name, text in backchannels.items():
+    # Bound concurrent TTS requests to stay under rate limits
+    semaphore = asyncio.Semaphore(5)
+    
+    async def generate_one(name: str, text: str) -> None:
         output_path = backchannel_dir / f"{name}.wav"
         
-        if output_path.exists():
-            print(f"⏭️  Skipping {name} (already exists)")
-            continue
-        
         try:
-            print(f"🔊 Generating: {name} ('{text}')...")
-            
-            # Generate audio using TTS
-            response = await client.audio.speech.create(
-                model="tts-1",
-                voice="alloy",
-                input=text,
-                response_format="pcm"  # Get raw PCM data for resampling
-            )
-            
-            # Get audio bytes
-            audio_bytes = await response.aread()
+            async with semaphore:
+                print(f"🔊 Generating: {name} ('{text}')...")
+                
+                # Generate audio using TTS
+                response = await client.audio.speech.create(
+                    model="tts-1",
+                    voice="alloy",
+                    input=text,
+                    response_format="pcm"  # Get raw PCM data for resampling
+                )
+                
+                # Get audio bytes
+                audio_bytes = await response.aread()
             
             # Convert bytes to numpy array (24kHz, 16-bit PCM)
             audio_24k = np.frombuffer(audio_bytes, dtype=np.int16)
             
-            # Resample from 24kHz to 16kHz
-            num_samples_16k = int(len(audio_24k) * 16000 / 24000)
-            audio_16k = signal.resample(audio_24k, num_samples_16k).astype(np.int16)
+            # Resample from 24kHz to 16kHz (exact 2:3 ratio, polyphase FIR)
+            # in a worker thread so other downloads keep progressing
+            audio_16k = await asyncio.to_thread(signal.resample_poly, audio_24k, 2, 3)
+            audio_16k = audio_16k.astype(np.int16)
             
             # Save as WAV file at 16kHz
             with wave.open(str(output_path), 'wb') as wav_file:
@@ -79,11 +80,21 @@ async def generate_backchannels():
             # Get file size
             size_kb = output_path.stat().st_size / 1024
             
-            print(f"   ✅ Saved to {output_path} ({size_kb:.1f} KB, 16kHz)")
+            print(f"   ✅ Saved {name} to {output_path} ({size_kb:.1f} KB, 16kHz)")
         
         except Exception as e:
             print(f"   ❌ Error generating {name}: {e}")
     
+    pending = []
+    for name, text in backchannels.items():
+        if (backchannel_dir / f"{name}.wav").exists():
+            print(f"⏭️  Skipping {name} (already exists)")
+            continue
+        pending.append(generate_one(name, text))
+    
+    # Fetch all phrases concurrently
+    await asyncio.gather(*pending)
+    
     print("=" * 60)
     print("✅ Backchannel generation complete!")
     print(f"📁 Files saved to: {backchannel_dir.absolute()}")
@@ -0,0 +1,37 @@
+"""Quantize the Silero VAD ONNX model to int8 weights."""
+from pathlib import Path
+import sys
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+
+def quantize_vad_model(input_path: Path, output_path: Path) -> None:
+    """
+    Write a dynamically quantized (int8 weight) copy of the VAD model.
+    
+    Args:
+        input_path: FP32 Silero VAD model
+        output_path: Where to write the int8 model
+    """
+    if not input_path.exists():
+        print(f"❌ ERROR: VAD model not found at {input_path}")
+        print("Download silero_vad.onnx into the models/ directory first")
+        return
+    
+    print(f"🔧 Quantizing {input_path} (int8 weights)...")
+    
+    # LSTM/MatMul weights become int8; activations are quantized at runtime
+    quantize_dynamic(str(input_path), str(output_path), weight_type=QuantType.QInt8)
+    
+    size_before = input_path.stat().st_size / 1024
+    size_after = output_path.stat().st_size / 1024
+    
+    print(f"✅ Saved {output_path} ({size_before:.0f} KB -> {size_after:.0f} KB)")
+    print(f"👉 Use it by setting VAD_MODEL_PATH={output_path} in .env")
+
+
+if __name__ == "__main__":
+    models_dir = Path("models")
+    input_model = Path(sys.argv[1]) if len(sys.argv) > 1 else models_dir / "silero_vad.onnx"
+    output_model = Path(sys.argv[2]) if len(sys.argv) > 2 else models_dir / "silero_vad_int8.onnx"
+    quantize_vad_model(input_model, output_model)
@@ -1,10 +1,10 @@
 """Audio mixer for multi-channel audio."""
 import asyncio
 import numpy as np
-from collections import deque
 from typing import Optional
 
 from .config import config
+from .audio_utils import ChunkBuffer, float_to_int16
 
 
 class AudioMixer:
@@ -19,24 +19,39 @@ class AudioMixer:
     - Real-time mixing
     - Volume control per channel
     - Output buffering
+    
+    Mixing runs on int16 samples end to end: producers are converted
+    (with their channel volume) once on submission, overlapping spans are
+    combined with a saturating add, and the output is ready for WebRTC.
+    
+    All methods run on the event loop thread and never await while
+    touching the buffers, so producers and the mixing loop need no lock.
     """
     
     def __init__(self):
         """Initialize audio mixer."""
         self.sample_rate = config.sample_rate
         
-        # Channel buffers
-        self.primary_buffer = deque()
-        self.secondary_buffer = deque()
+        # Channel buffers (int16)
+        self.primary_buffer = ChunkBuffer(np.int16)
+        self.secondary_buffer = ChunkBuffer(np.int16)
         
-        # Output buffer
-        self.output_buffer = deque()
+        # Output buffer (int16)
+        self.output_buffer = ChunkBuffer(np.int16)
         
-        # Volume levels
+        # Volume levels (applied on submission)
         self.primary_volume = 1.0
         self.secondary_volume = config.backchannel_volume
         
-        self._lock = asyncio.Lock()
+        # int32 accumulator reused for the saturating add
+        self._mix_scratch = np.empty(0, dtype=np.int32)
+        
+        # Set by producers whenever a channel has new audio
+        self._data_ready = asyncio.Event()
+        
+        # Set while no primary (agent speech) audio is queued or unplayed
+        self._primary_idle = asyncio.Event()
+        self._primary_idle.set()
         
         # Mixing task
         self.running = False
@@ -59,80 +74,111 @@ class AudioMixer:
                 pass
         print("✓ Audio mixer stopped")
     
-    async def add_primary_audio(self, audio: np.ndarray) -> None:
+    def add_primary_audio(self, audio: np.ndarray) -> None:
         """
         Add audio to primary channel.
         
         Args:
-            audio: Audio samples
+            audio: Audio samples (float in [-1, 1] or int16)
         """
-        async with self._lock:
-            self.primary_buffer.extend(audio * self.primary_volume)
+        self.primary_buffer.append(self._to_int16(audio, self.primary_volume))
+        self._primary_idle.clear()
+        self._data_ready.set()
     
-    async def add_secondary_audio(self, audio: np.ndarray) -> None:
+    def add_secondary_audio(self, audio: np.ndarray) -> None:
         """
         Add audio to secondary channel (backchannels).
         
         Args:
-            audio: Audio samples
+            audio: Audio samples (float in [-1, 1] or int16)
+        """
+        self.secondary_buffer.append(self._to_int16(audio, self.secondary_volume))
+        self._data_ready.set()
+    
+    def prepare_secondary_audio(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Convert a clip to a ready-to-queue secondary block.
+        
+        Args:
+            audio: Audio samples (float in [-1, 1] or int16)
+        
+        Returns:
+            Read-only int16 block with channel volume applied
+        """
+        block = np.ascontiguousarray(self._to_int16(audio, self.secondary_volume))
+        if block is audio:
+            block = block.copy()
+        block.flags.writeable = False
+        return block
+    
+    def add_secondary_block(self, block: np.ndarray) -> None:
+        """
+        Queue a block from prepare_secondary_audio on the secondary channel.
+        
+        Args:
+            block: Prepared int16 block (queued as-is, no copy)
         """
-        async with self._lock:
-            self.secondary_buffer.extend(audio * self.secondary_volume)
+        self.secondary_buffer.append(block)
+        self._data_ready.set()
+    
+    @staticmethod
+    def _to_int16(audio: np.ndarray, volume: float) -> np.ndarray:
+        """Convert submitted audio to int16 with channel volume applied."""
+        if audio.dtype != np.int16:
+            return float_to_int16(audio, volume)
+        if volume == 1.0:
+            return audio
+        return np.multiply(audio, np.float32(volume), dtype=np.float32).astype(np.int16)
     
     async def _mixing_loop(self) -> None:
         """Main mixing loop."""
         while self.running:
             try:
-                await self._mix_channels()
-                await asyncio.sleep(0.01)  # 10ms mixing interval
+                # Sleep until a producer submits audio
+                await self._data_ready.wait()
+                self._data_ready.clear()
+                self._mix_channels()
             except Exception as e:
                 print(f"Mixer error: {e}")
                 await asyncio.sleep(0.1)
     
-    async def _mix_channels(self) -> None:
+    def _mix_channels(self) -> None:
         """Mix channels into output buffer."""
-        async with self._lock:
-            # Determine how many samples to mix
-            primary_len = len(self.primary_buffer)
-            secondary_len = len(self.secondary_buffer)
-            
-            if primary_len == 0 and secondary_len == 0:
-                return
-            
-            # Mix up to the minimum length (or all if one is empty)
-            mix_len = max(primary_len, secondary_len)
-            
-            if mix_len == 0:
-                return
-            
-            # Get samples from each channel
-            primary_samples = []
-            secondary_samples = []
-            
-            for _ in range(min(mix_len, primary_len)):
-                primary_samples.append(self.primary_buffer.popleft())
-            
-            for _ in range(min(mix_len, secondary_len)):
-                secondary_samples.append(self.secondary_buffer.popleft())
-            
-            # Pad shorter channel with zeros
-            if len(primary_samples) < mix_len:
-                primary_samples.extend([0.0] * (mix_len - len(primary_samples)))
-            
-            if len(secondary_samples) < mix_len:
-                secondary_samples.extend([0.0] * (mix_len - len(secondary_samples)))
-            
-            # Mix (simple addition with clipping)
-            primary_arr = np.array(primary_samples, dtype=np.float32)
-            secondary_arr = np.array(secondary_samples, dtype=np.float32)
-            
-            mixed = primary_arr + secondary_arr
-            
-            # Clip to [-1, 1]
-            mixed = np.clip(mixed, -1.0, 1.0)
-            
-            # Add to output buffer
-            self.output_buffer.extend(mixed)
+        # Determine how many samples to mix
+        primary_len = len(self.primary_buffer)
+        secondary_len = len(self.secondary_buffer)
+        
+        if primary_len == 0 and secondary_len == 0:
+            return
+        
+        # Mix up to the longer channel (shorter one is zero-padded)
+        mix_len = max(primary_len, secondary_len)
+        
+        # Take whole blocks from each channel
+        primary_arr = self.primary_buffer.read()
+        secondary_arr = self.secondary_buffer.read()
+        
+        # Single channel: pass through untouched
+        if not secondary_len or not primary_len:
+            self.output_buffer.append(primary_arr if primary_len else secondary_arr)
+            return
+        
+        # Start from whichever channel is longer
+        mixed = np.empty(mix_len, dtype=np.int16)
+        mixed[:primary_len] = primary_arr
+        mixed[primary_len:] = secondary_arr[primary_len:]
+        
+        # Saturating add where both channels have audio
+        overlap = min(primary_len, secondary_len)
+        if len(self._mix_scratch) < overlap:
+            self._mix_scratch = np.empty(overlap, dtype=np.int32)
+        acc = self._mix_scratch[:overlap]
+        np.add(primary_arr[:overlap], secondary_arr[:overlap], out=acc, dtype=np.int32)
+        np.clip(acc, -32768, 32767, out=acc)
+        mixed[:overlap] = acc
+        
+        # Add to output buffer
+        self.output_buffer.append(mixed)
     
     def get_output_audio(self, num_samples: Optional[int] = None) -> Optional[np.ndarray]:
         """
@@ -142,24 +188,40 @@ class AudioMixer:
             num_samples: Number of samples to retrieve
         
         Returns:
-            Mixed audio or None if buffer empty
+            Mixed int16 audio or None if buffer empty
         """
         if not self.output_buffer:
+            self._update_primary_idle()
             return None
         
-        if num_samples is None:
-            num_samples = len(self.output_buffer)
-        
-        num_samples = min(num_samples, len(self.output_buffer))
+        audio = self.output_buffer.read(num_samples)
+        self._update_primary_idle()
+        return audio
+    
+    def _update_primary_idle(self) -> None:
+        """Signal waiters once all primary audio has been played out."""
+        if not self.output_buffer and not self.primary_buffer:
+            self._primary_idle.set()
+    
+    async def wait_primary_drained(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until queued primary audio has been played out.
         
-        samples = []
-        for _ in range(num_samples):
-            samples.append(self.output_buffer.popleft())
+        Args:
+            timeout: Maximum seconds to wait (None for no limit)
         
-        return np.array(samples, dtype=np.float32)
+        Returns:
+            True if drained, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._primary_idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
     
     def clear_buffers(self) -> None:
         """Clear all buffers."""
         self.primary_buffer.clear()
         self.secondary_buffer.clear()
         self.output_buffer.clear()
+        self._primary_idle.set()
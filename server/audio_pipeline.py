@@ -1,12 +1,13 @@
 """Audio pipeline for buffering and processing audio streams."""
-import numpy as np
-from collections import deque
-from typing import Optional, Generator
 import asyncio
+import numpy as np
+from math import gcd
+from typing import Dict, Generator, Optional, Tuple
 from scipy import signal as scipy_signal
 
 from .config import config
 from .event_bus import event_bus, EventType
+from .audio_utils import ChunkBuffer, RingBuffer
 
 
 class AudioPipeline:
@@ -19,6 +20,9 @@ class AudioPipeline:
     - Whisper chunk accumulator (1.5s with 0.5s overlap)
     - Audio format conversion
     - Bidirectional audio flow
+    
+    Buffers are only touched from the event loop thread and no method
+    awaits mid-update, so a single producer and consumer need no lock.
     """
     
     def __init__(self):
@@ -29,22 +33,33 @@ class AudioPipeline:
         # Circular buffer for 30 seconds of audio
         self.buffer_duration_s = 30
         self.buffer_size = self.sample_rate * self.buffer_duration_s
-        self.circular_buffer = deque(maxlen=self.buffer_size)
+        self.circular_buffer = RingBuffer(self.buffer_size)
         
         # VAD chunk accumulator (30ms chunks)
         self.vad_chunk_size = config.get_chunk_size_samples()
-        self.vad_accumulator = []
+        self.vad_accumulator = ChunkBuffer()
+        
+        # Set when at least one full VAD chunk is waiting
+        self.vad_ready = asyncio.Event()
         
         # Whisper chunk accumulator (1.5s chunks with 0.5s overlap)
         self.whisper_chunk_size = config.get_whisper_chunk_size_samples()
         self.whisper_overlap_size = config.get_whisper_overlap_samples()
-        self.whisper_accumulator = []
+        self.whisper_accumulator = ChunkBuffer()
         self.whisper_last_chunk = []
         
+        # Completed Whisper chunks, handed to the transcription coordinator
+        self.whisper_queue: asyncio.Queue = asyncio.Queue()
+        
         # Output buffer for playback
-        self.output_buffer = deque()
+        self.output_buffer = ChunkBuffer()
+        
+        # Polyphase resampling filters keyed by (up, down)
+        self._resample_filters: Dict[Tuple[int, int], np.ndarray] = {}
         
-        self._lock = asyncio.Lock()
+        # AUDIO_CHUNK_RECEIVED is coalesced to one event per 100ms
+        self.event_interval_samples = int(self.sample_rate * 0.1)
+        self._samples_since_event = 0
     
     async def receive_audio(self, audio_data: np.ndarray) -> None:
         """
@@ -53,26 +68,33 @@ class AudioPipeline:
         Args:
             audio_data: Audio samples as numpy array
         """
-        async with self._lock:
-            # Ensure mono
-            if len(audio_data.shape) > 1:
-                audio_data = self.convert_to_mono(audio_data)
-            
-            # Debug: Log audio reception
-            audio_level = np.abs(audio_data).max()
-            print(f"📥 Audio received: {len(audio_data)} samples, level: {audio_level:.4f}")
-            
-            # Add to circular buffer
-            self.circular_buffer.extend(audio_data)
-            
-            # Add to accumulators
-            self.vad_accumulator.extend(audio_data)
-            self.whisper_accumulator.extend(audio_data)
-            
-            # Emit event
+        # Ensure mono
+        if len(audio_data.shape) > 1:
+            audio_data = self.convert_to_mono(audio_data)
+        
+        # Add to circular buffer
+        self.circular_buffer.write(audio_data)
+        
+        # Add to accumulators
+        self.vad_accumulator.append(audio_data)
+        self.whisper_accumulator.append(audio_data)
+        
+        if len(self.vad_accumulator) >= self.vad_chunk_size:
+            self.vad_ready.set()
+        
+        # Queue Whisper chunks as soon as they are complete
+        if len(self.whisper_accumulator) >= self.whisper_chunk_size:
+            for chunk in self.get_whisper_chunks():
+                self.whisper_queue.put_nowait(chunk)
+        
+        # Emit event once enough audio has accumulated
+        self._samples_since_event += len(audio_data)
+        if self._samples_since_event >= self.event_interval_samples:
+            samples = self._samples_since_event
+            self._samples_since_event = 0
             await event_bus.emit(EventType.AUDIO_CHUNK_RECEIVED, {
-                "samples": len(audio_data),
-                "duration_ms": len(audio_data) / self.sample_rate * 1000
+                "samples": samples,
+                "duration_ms": samples / self.sample_rate * 1000
             })
     
     def resample_audio(self, audio: np.ndarray, original_rate: int) -> np.ndarray:
@@ -89,11 +111,38 @@ class AudioPipeline:
         if original_rate == self.sample_rate:
             return audio
         
-        # Calculate resampling ratio
-        num_samples = int(len(audio) * self.sample_rate / original_rate)
-        resampled = scipy_signal.resample(audio, num_samples)
+        # Reduce to an integer up/down ratio (e.g. 48kHz -> 16kHz is 1/3)
+        g = gcd(self.sample_rate, original_rate)
+        up = self.sample_rate // g
+        down = original_rate // g
+        
+        # Polyphase FIR with a cached filter: cost is linear in the block size
+        resampled = scipy_signal.resample_poly(
+            audio, up, down, window=self._get_resample_filter(up, down)
+        )
         return resampled.astype(np.float32)
     
+    def _get_resample_filter(self, up: int, down: int) -> np.ndarray:
+        """
+        Get (and cache) the anti-aliasing FIR for a resampling ratio.
+        
+        Args:
+            up: Upsampling factor
+            down: Downsampling factor
+        
+        Returns:
+            FIR filter taps
+        """
+        key = (up, down)
+        taps = self._resample_filters.get(key)
+        if taps is None:
+            max_rate = max(up, down)
+            taps = scipy_signal.firwin(
+                2 * 10 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0)
+            )
+            self._resample_filters[key] = taps
+        return taps
+    
     def convert_to_mono(self, audio: np.ndarray) -> np.ndarray:
         """
         Convert stereo/multi-channel audio to mono.
@@ -118,9 +167,7 @@ class AudioPipeline:
             Audio chunks of 30ms duration
         """
         while len(self.vad_accumulator) >= self.vad_chunk_size:
-            chunk = np.array(self.vad_accumulator[:self.vad_chunk_size], dtype=np.float32)
-            self.vad_accumulator = self.vad_accumulator[self.vad_chunk_size:]
-            yield chunk
+            yield self.vad_accumulator.read(self.vad_chunk_size)
     
     def get_whisper_chunks(self) -> Generator[np.ndarray, None, None]:
         """
@@ -131,23 +178,31 @@ class AudioPipeline:
         """
         while len(self.whisper_accumulator) >= self.whisper_chunk_size:
             # Get chunk
-            chunk = np.array(self.whisper_accumulator[:self.whisper_chunk_size], dtype=np.float32)
+            chunk = self.whisper_accumulator.read(self.whisper_chunk_size)
             
-            # Move forward by (chunk_size - overlap_size)
+            # Move forward by (chunk_size - overlap_size): push overlap back
             step_size = self.whisper_chunk_size - self.whisper_overlap_size
-            self.whisper_accumulator = self.whisper_accumulator[step_size:]
+            self.whisper_accumulator.appendleft(chunk[step_size:])
             
             yield chunk
     
-    async def add_output_audio(self, audio: np.ndarray) -> None:
+    async def next_whisper_chunk(self) -> np.ndarray:
+        """
+        Wait for the next complete Whisper chunk.
+        
+        Returns:
+            Audio chunk of 1.5s duration (with overlap)
+        """
+        return await self.whisper_queue.get()
+    
+    def add_output_audio(self, audio: np.ndarray) -> None:
         """
         Add audio to output buffer for playback.
         
         Args:
             audio: Audio samples to play
         """
-        async with self._lock:
-            self.output_buffer.extend(audio)
+        self.output_buffer.append(audio)
     
     def get_output_audio(self, num_samples: Optional[int] = None) -> Optional[np.ndarray]:
         """
@@ -162,16 +217,7 @@ class AudioPipeline:
         if not self.output_buffer:
             return None
         
-        if num_samples is None:
-            num_samples = len(self.output_buffer)
-        
-        num_samples = min(num_samples, len(self.output_buffer))
-        
-        samples = []
-        for _ in range(num_samples):
-            samples.append(self.output_buffer.popleft())
-        
-        return np.array(samples, dtype=np.float32)
+        return self.output_buffer.read(num_samples)
     
     def clear_buffers(self) -> None:
         """Clear all buffers."""
@@ -179,7 +225,10 @@ class AudioPipeline:
         self.vad_accumulator.clear()
         self.whisper_accumulator.clear()
         self.whisper_last_chunk.clear()
+        while not self.whisper_queue.empty():
+            self.whisper_queue.get_nowait()
         self.output_buffer.clear()
+        self._samples_since_event = 0
     
     def get_buffer_fill_level(self) -> dict:
         """
@@ -206,8 +255,6 @@ class AudioPipeline:
             Recent audio samples
         """
         num_samples = int(duration_s * self.sample_rate)
-        num_samples = min(num_samples, len(self.circular_buffer))
         
         # Get last N samples
-        recent = list(self.circular_buffer)[-num_samples:]
-        return np.array(recent, dtype=np.float32)
+        return self.circular_buffer.latest(num_samples)
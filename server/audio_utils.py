@@ -0,0 +1,217 @@
+"""Shared audio buffer and sample format helpers."""
+import numpy as np
+from collections import deque
+from typing import Optional
+
+
+def float_to_int16(audio: np.ndarray, gain: float = 1.0) -> np.ndarray:
+    """
+    Convert float samples in [-1, 1] to int16, rounding to nearest with saturation.
+    
+    Args:
+        audio: Float audio samples
+        gain: Linear gain applied during conversion
+    
+    Returns:
+        int16 samples clipped to the int16 range
+    """
+    scaled = np.multiply(audio, np.float32(32767.0 * gain), dtype=np.float32)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    # Round instead of truncating toward zero (no dead zone around 0)
+    np.rint(scaled, out=scaled)
+    return scaled.astype(np.int16)
+
+
+def int16_to_float32_mono(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert int16 samples to float32 in [-1, 1), averaging channels to mono.
+    
+    Args:
+        audio: int16 samples shaped (num_samples, channels)
+    
+    Returns:
+        1-D float32 mono samples
+    """
+    channels = audio.shape[1]
+    if channels == 1:
+        # One cast into a fresh array, then scale in place (no temporaries)
+        mono = audio.reshape(-1).astype(np.float32)
+    else:
+        mono = audio.sum(axis=1, dtype=np.float32)
+    
+    mono *= np.float32(1.0 / (32768.0 * channels))
+    return mono
+
+
+class ChunkBuffer:
+    """
+    FIFO of audio samples stored as whole numpy blocks.
+    
+    Features:
+    - O(1) append of a block (no per-sample Python objects)
+    - Bulk reads that concatenate only the blocks they touch
+    - Partial reads keep the remainder as a view (no copy)
+    
+    Appended blocks are owned by the buffer and must not be modified
+    by the caller afterwards.
+    """
+    
+    def __init__(self, dtype=np.float32):
+        """
+        Initialize chunk buffer.
+        
+        Args:
+            dtype: Sample dtype of stored blocks
+        """
+        self.dtype = np.dtype(dtype)
+        self._chunks: deque = deque()
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, audio: np.ndarray) -> None:
+        """
+        Append a block of samples.
+        
+        Args:
+            audio: 1-D audio samples
+        """
+        audio = np.asarray(audio, dtype=self.dtype)
+        if audio.size == 0:
+            return
+        self._chunks.append(audio)
+        self._size += audio.size
+    
+    def appendleft(self, audio: np.ndarray) -> None:
+        """
+        Push a block of samples back to the front of the buffer.
+        
+        Args:
+            audio: 1-D audio samples
+        """
+        audio = np.asarray(audio, dtype=self.dtype)
+        if audio.size == 0:
+            return
+        self._chunks.appendleft(audio)
+        self._size += audio.size
+    
+    def read(self, num_samples: Optional[int] = None) -> np.ndarray:
+        """
+        Remove and return samples from the front of the buffer.
+        
+        Args:
+            num_samples: Number of samples to read (None for all)
+        
+        Returns:
+            Up to num_samples samples (empty array if buffer empty)
+        """
+        if num_samples is None or num_samples > self._size:
+            num_samples = self._size
+        
+        if num_samples <= 0:
+            return np.empty(0, dtype=self.dtype)
+        
+        # Fast path: request served from the head block
+        head = self._chunks[0]
+        if len(head) >= num_samples:
+            self._chunks.popleft()
+            if len(head) > num_samples:
+                self._chunks.appendleft(head[num_samples:])
+            self._size -= num_samples
+            return head[:num_samples]
+        
+        # Gather whole blocks, split the last one if needed
+        parts = []
+        remaining = num_samples
+        while remaining > 0:
+            chunk = self._chunks.popleft()
+            if len(chunk) > remaining:
+                self._chunks.appendleft(chunk[remaining:])
+                chunk = chunk[:remaining]
+            parts.append(chunk)
+            remaining -= len(chunk)
+        
+        self._size -= num_samples
+        return np.concatenate(parts)
+    
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._chunks.clear()
+        self._size = 0
+
+
+class RingBuffer:
+    """
+    Fixed-capacity ring holding the most recent audio samples.
+    
+    Writes overwrite the oldest samples; reads of the last N samples
+    cost O(N) regardless of capacity.
+    """
+    
+    def __init__(self, capacity: int, dtype=np.float32):
+        """
+        Initialize ring buffer.
+        
+        Args:
+            capacity: Maximum number of samples kept
+            dtype: Sample dtype
+        """
+        self.capacity = capacity
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._write_pos = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def write(self, audio: np.ndarray) -> None:
+        """
+        Write samples, overwriting the oldest ones when full.
+        
+        Args:
+            audio: 1-D audio samples
+        """
+        n = len(audio)
+        if n == 0:
+            return
+        
+        if n >= self.capacity:
+            self._buffer[:] = audio[-self.capacity:]
+            self._write_pos = 0
+            self._size = self.capacity
+            return
+        
+        end = self._write_pos + n
+        if end <= self.capacity:
+            self._buffer[self._write_pos:end] = audio
+        else:
+            first = self.capacity - self._write_pos
+            self._buffer[self._write_pos:] = audio[:first]
+            self._buffer[:n - first] = audio[first:]
+        
+        self._write_pos = end % self.capacity
+        self._size = min(self._size + n, self.capacity)
+    
+    def latest(self, num_samples: int) -> np.ndarray:
+        """
+        Get a copy of the most recent samples.
+        
+        Args:
+            num_samples: Number of samples to return
+        
+        Returns:
+            Up to num_samples most recent samples, oldest first
+        """
+        num_samples = max(0, min(num_samples, self._size))
+        start = (self._write_pos - num_samples) % self.capacity
+        
+        if start + num_samples <= self.capacity:
+            return self._buffer[start:start + num_samples].copy()
+        
+        return np.concatenate((self._buffer[start:], self._buffer[:self._write_pos]))
+    
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._write_pos = 0
+        self._size = 0
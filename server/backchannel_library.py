@@ -1,8 +1,8 @@
 """Backchannel audio library management."""
+import struct
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Optional
-import wave
+from typing import Dict, List, Optional, Tuple
 
 from .config import config
 
@@ -62,36 +62,66 @@ class BackchannelLibrary:
             path: Path to WAV file
         
         Returns:
-            Audio data as numpy array
+            Volume-scaled int16 audio
         """
-        with wave.open(str(path), 'rb') as wav:
-            # Validate format
-            channels = wav.getnchannels()
-            sample_width = wav.getsampwidth()
-            framerate = wav.getframerate()
-            
-            if channels != 1:
-                raise ValueError(f"Expected mono audio, got {channels} channels")
-            
-            if framerate != self.sample_rate:
-                raise ValueError(f"Expected {self.sample_rate}Hz, got {framerate}Hz")
-            
-            # Read audio data
-            frames = wav.readframes(wav.getnframes())
-            
-            # Convert to numpy array
-            if sample_width == 2:  # 16-bit
-                audio = np.frombuffer(frames, dtype=np.int16)
-            else:
-                raise ValueError(f"Unsupported sample width: {sample_width}")
-            
-            # Convert to float32 [-1, 1]
-            audio = audio.astype(np.float32) / 32768.0
-            
-            # Normalize volume
-            audio = audio * self.volume
+        framerate, data_offset, n_samples = self._parse_wav_header(path)
+        
+        # Map the PCM data region directly (no intermediate bytes copy)
+        pcm = np.memmap(path, dtype='<i2', mode='r', offset=data_offset, shape=(n_samples,))
+        
+        # Normalize volume (stays int16 for the mixer) into a fresh array,
+        # then drop the mapping
+        audio = np.multiply(pcm, np.float32(self.volume), dtype=np.float32).astype(np.int16)
+        del pcm
+        
+        # Clips are shared by every playback; keep them immutable
+        audio.flags.writeable = False
+        
+        return audio
+    
+    def _parse_wav_header(self, path: Path) -> Tuple[int, int, int]:
+        """
+        Walk the RIFF chunks of a WAV file and validate its format.
+        
+        Args:
+            path: Path to WAV file
+        
+        Returns:
+            Tuple of (sample_rate, data_offset, num_samples)
+        """
+        with open(path, 'rb') as f:
+            riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+            if riff != b'RIFF' or wave_id != b'WAVE':
+                raise ValueError("Not a RIFF/WAVE file")
             
-            return audio
+            framerate = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    raise ValueError("No data chunk found")
+                chunk_id, chunk_size = struct.unpack('<4sI', header)
+                
+                if chunk_id == b'fmt ':
+                    fmt = f.read(chunk_size)
+                    audio_format, channels, framerate, _, _, bits = struct.unpack('<HHIIHH', fmt[:16])
+                    
+                    # Validate format
+                    if audio_format != 1 or bits != 16:
+                        raise ValueError(f"Expected 16-bit PCM, got format {audio_format} ({bits}-bit)")
+                    if channels != 1:
+                        raise ValueError(f"Expected mono audio, got {channels} channels")
+                    if framerate != self.sample_rate:
+                        raise ValueError(f"Expected {self.sample_rate}Hz, got {framerate}Hz")
+                elif chunk_id == b'data':
+                    if framerate is None:
+                        raise ValueError("data chunk before fmt chunk")
+                    data_offset = f.tell()
+                    # Clamp to the real file size (streamed WAVs may lie)
+                    available = path.stat().st_size - data_offset
+                    return framerate, data_offset, min(chunk_size, available) // 2
+                else:
+                    # Chunks are word-aligned
+                    f.seek(chunk_size + (chunk_size & 1), 1)
     
     def get_backchannel(self, name: str) -> Optional[np.ndarray]:
         """
@@ -1,5 +1,7 @@
 """Backchannel playback coordination."""
-from typing import Optional
+import asyncio
+import numpy as np
+from typing import Dict, Optional, Set
 
 from .config import config
 from .event_bus import event_bus, EventType, Event
@@ -30,6 +32,15 @@ class BackchannelPlayer:
         self.mixer = audio_mixer
         self.conversation_manager = conversation_manager
         
+        # Clips already converted for the mixer's secondary channel
+        self._mixer_ready: Dict[str, np.ndarray] = {
+            name: self.mixer.prepare_secondary_audio(audio)
+            for name, audio in self.library.backchannels.items()
+        }
+        
+        # Bookkeeping tasks kept alive until they finish
+        self._pending_tasks: Set[asyncio.Task] = set()
+        
         # Subscribe to events
         event_bus.subscribe(EventType.BACKCHANNEL_TRIGGERED, self.on_backchannel_triggered)
     
@@ -40,11 +51,13 @@ class BackchannelPlayer:
         Args:
             event: BACKCHANNEL_TRIGGERED event
         """
+        payload = event.data
+        
         # Only proceed if this is a playback event
-        if not event.data.get("proceed_to_play"):
+        if not payload.proceed_to_play:
             return
         
-        backchannel_type = event.data.get("backchannel_type")
+        backchannel_type = payload.backchannel_type
         
         if backchannel_type:
             await self.play_backchannel(backchannel_type)
@@ -56,29 +69,45 @@ class BackchannelPlayer:
         Args:
             backchannel_type: Type of backchannel to play
         """
-        # Get audio from library
-        audio = self.library.get_backchannel(backchannel_type)
+        # Get prepared clip (no per-play conversion)
+        audio = self._mixer_ready.get(backchannel_type)
         
         if audio is None:
             print(f"WARNING: Backchannel '{backchannel_type}' not found in library")
             return
         
         # Send to mixer on secondary channel
-        await self.mixer.add_secondary_audio(audio)
+        self.mixer.add_secondary_block(audio)
         
-        # Record in conversation manager
-        # Note: We assume success here. In a real system, you'd track
-        # whether the user continued speaking after the backchannel.
-        await self.conversation_manager.record_backchannel(
-            backchannel_type=backchannel_type,
-            was_successful=True  # Simplified for now
-        )
-        
-        # Emit played event
-        await event_bus.emit(EventType.BACKCHANNEL_PLAYED, {
-            "backchannel_type": backchannel_type,
-            "duration_s": len(audio) / config.sample_rate
-        })
+        # Bookkeeping runs in the background so it never delays playback
+        task = asyncio.create_task(self._finalize(backchannel_type, audio))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
         
         # Note: We do NOT change conversation state
         # User should still be in USER_SPEAKING state
+    
+    async def _finalize(self, backchannel_type: str, audio: np.ndarray) -> None:
+        """
+        Record the backchannel and emit the played event.
+        
+        Args:
+            backchannel_type: Type of backchannel played
+            audio: Audio that was sent to the mixer
+        """
+        try:
+            # Record in conversation manager
+            # Note: We assume success here. In a real system, you'd track
+            # whether the user continued speaking after the backchannel.
+            await self.conversation_manager.record_backchannel(
+                backchannel_type=backchannel_type,
+                was_successful=True  # Simplified for now
+            )
+            
+            # Emit played event
+            await event_bus.emit(EventType.BACKCHANNEL_PLAYED, {
+                "backchannel_type": backchannel_type,
+                "duration_s": len(audio) / config.sample_rate
+            })
+        except Exception as e:
+            print(f"ERROR finalizing backchannel '{backchannel_type}': {e}")
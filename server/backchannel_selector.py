@@ -1,9 +1,8 @@
 """Backchannel selection logic."""
 import random
-from collections import deque
 from typing import List, Dict
 
-from .event_bus import event_bus, EventType, Event
+from .event_bus import event_bus, EventType, Event, BackchannelPayload
 from .conversation_manager import ConversationManager
 
 
@@ -17,6 +16,13 @@ class BackchannelSelector:
     - Weighted randomization
     """
     
+    # Small-int ids for the known backchannel types (bit positions in masks)
+    _IDS: Dict[str, int] = {"mmhmm": 0, "okay": 1, "yeah": 2, "i_see": 3, "right": 4}
+    
+    # Context cues (built once, not per selection)
+    _QUESTION_PREFIXES = ('what', 'when', 'where', 'who', 'why', 'how')
+    _EMOTION_WORDS = ("amazing", "terrible", "wonderful", "awful", "excited", "love", "hate")
+    
     def __init__(self, conversation_manager: ConversationManager):
         """
         Initialize backchannel selector.
@@ -26,8 +32,11 @@ class BackchannelSelector:
         """
         self.conversation_manager = conversation_manager
         
-        # Recent backchannels (for anti-repetition)
-        self.recent_backchannels = deque(maxlen=3)
+        # Bound once; used for every weighted draw
+        self._rand = random.random
+        
+        # Last backchannel id (for anti-repetition), -1 if none
+        self._last = -1
         
         # Usage count (for balancing)
         self.usage_count: Dict[str, int] = {
@@ -48,6 +57,11 @@ class BackchannelSelector:
         Args:
             event: BACKCHANNEL_TRIGGERED event
         """
+        # Only handle raw triggers; our own selection events carry a type
+        payload = event.data
+        if payload.backchannel_type is not None:
+            return
+        
         # Get context
         transcript = self.conversation_manager.get_user_transcript_current_turn()
         
@@ -58,11 +72,11 @@ class BackchannelSelector:
         self.record_usage(selected)
         
         # Emit selection event (for timing controller)
-        await event_bus.emit(EventType.BACKCHANNEL_TRIGGERED, {
-            "backchannel_type": selected,
-            "trigger_strength": event.data.get("trigger_strength", 0.4),
-            "silence_duration_ms": event.data.get("silence_duration_ms", 0)
-        })
+        await event_bus.emit(EventType.BACKCHANNEL_TRIGGERED, BackchannelPayload(
+            backchannel_type=selected,
+            trigger_strength=payload.trigger_strength,
+            silence_duration_ms=payload.silence_duration_ms
+        ))
     
     def select_backchannel(self, transcript: str) -> str:
         """
@@ -85,12 +99,11 @@ class BackchannelSelector:
             candidates = list(self.usage_count.keys())
         
         # Select randomly from candidates
-        # Weight by inverse usage count (prefer less used)
-        weights = [1.0 / (self.usage_count[c] + 1) for c in candidates]
-        total_weight = sum(weights)
-        weights = [w / total_weight for w in weights]
-        
-        selected = random.choices(candidates, weights=weights, k=1)[0]
+        # Weight by inverse usage count (prefer less used). Efraimidis-Spirakis:
+        # the largest u ** (1 / weight) is a weighted draw, no CDF needed.
+        rand = self._rand
+        usage = self.usage_count
+        selected = max(candidates, key=lambda c: rand() ** (usage[c] + 1))
         
         return selected
     
@@ -106,16 +119,13 @@ class BackchannelSelector:
         """
         transcript_lower = transcript.lower()
         
-        # Question detection
-        if transcript.rstrip().endswith('?') or any(
-            transcript_lower.startswith(q) for q in ['what', 'when', 'where', 'who', 'why', 'how']
-        ):
+        # Question detection (one C-level prefix check for all question words)
+        if transcript.rstrip().endswith('?') or transcript_lower.startswith(self._QUESTION_PREFIXES):
             # Questions -> "right" or "I see"
             return ["right", "i_see"]
         
         # Emotional/excited tone detection
-        emotion_words = ["amazing", "terrible", "wonderful", "awful", "excited", "love", "hate"]
-        if any(word in transcript_lower for word in emotion_words):
+        if any(word in transcript_lower for word in self._EMOTION_WORDS):
             # Emotional -> "yeah"
             return ["yeah", "right"]
         
@@ -132,17 +142,13 @@ class BackchannelSelector:
         Returns:
             Filtered candidates
         """
-        # Remove last used
-        if self.recent_backchannels:
-            last_used = self.recent_backchannels[-1]
-            candidates = [c for c in candidates if c != last_used]
-        
-        # If same type used twice in a row, exclude it
-        if len(self.recent_backchannels) >= 2:
-            if self.recent_backchannels[-1] == self.recent_backchannels[-2]:
-                candidates = [c for c in candidates if c != self.recent_backchannels[-1]]
+        # Remove last used (covers "same type twice in a row" as well)
+        if self._last < 0:
+            return candidates
         
-        return candidates
+        forbidden_mask = 1 << self._last
+        ids = self._IDS
+        return [c for c in candidates if not (forbidden_mask >> ids.get(c, 31)) & 1]
     
     def record_usage(self, backchannel_type: str) -> None:
         """
@@ -151,5 +157,5 @@ class BackchannelSelector:
         Args:
             backchannel_type: Type of backchannel used
         """
-        self.recent_backchannels.append(backchannel_type)
+        self._last = self._IDS.get(backchannel_type, -1)
         self.usage_count[backchannel_type] = self.usage_count.get(backchannel_type, 0) + 1
@@ -1,9 +1,9 @@
 """Backchannel timing and abort control."""
 import asyncio
-from typing import Optional
+from typing import Optional, Set
 
 from .config import config
-from .event_bus import event_bus, EventType, Event
+from .event_bus import event_bus, EventType, Event, BackchannelPayload
 from .conversation_manager import ConversationState
 
 
@@ -24,9 +24,12 @@ class BackchannelTimingController:
         
         # State
         self.pending_backchannel: Optional[str] = None
-        self.safe_zone_task: Optional[asyncio.Task] = None
+        self.safe_zone_handle: Optional[asyncio.TimerHandle] = None
         self.is_waiting = False
         
+        # Playback tasks started by the timer, kept alive until they finish
+        self._playback_tasks: Set[asyncio.Task] = set()
+        
         # Subscribe to events
         event_bus.subscribe(EventType.BACKCHANNEL_TRIGGERED, self.on_backchannel_triggered)
         event_bus.subscribe(EventType.SPEECH_STARTED, self.on_speech_started)
@@ -38,11 +41,14 @@ class BackchannelTimingController:
         Args:
             event: BACKCHANNEL_TRIGGERED event with backchannel_type
         """
-        backchannel_type = event.data.get("backchannel_type")
+        payload = event.data
         
-        if not backchannel_type:
+        # Only selected backchannels that are not yet cleared for playback
+        if not payload.backchannel_type or payload.proceed_to_play:
             return
         
+        backchannel_type = payload.backchannel_type
+        
         # Start safe zone timer
         await self.start_safe_zone_timer(backchannel_type)
     
@@ -67,41 +73,37 @@ class BackchannelTimingController:
         self.pending_backchannel = backchannel_type
         self.is_waiting = True
         
-        # Create timer task
-        self.safe_zone_task = asyncio.create_task(
-            self._safe_zone_countdown()
+        # Schedule the safe zone check (a timer handle, not a task);
+        # a newer trigger replaces any pending one
+        if self.safe_zone_handle:
+            self.safe_zone_handle.cancel()
+        loop = asyncio.get_running_loop()
+        self.safe_zone_handle = loop.call_later(
+            self.safe_zone_ms / 1000, self._on_safe_zone_elapsed
         )
     
-    async def _safe_zone_countdown(self) -> None:
-        """Safe zone countdown (300ms)."""
-        try:
-            # Wait for safe zone duration
-            await asyncio.sleep(self.safe_zone_ms / 1000)
-            
-            # If we get here, safe zone completed without interruption
-            if self.is_waiting and self.pending_backchannel:
-                await self.proceed_to_playback()
-        
-        except asyncio.CancelledError:
-            # Timer was cancelled (user resumed speaking)
-            pass
+    def _on_safe_zone_elapsed(self) -> None:
+        """Safe zone timer callback (300ms)."""
+        self.safe_zone_handle = None
+        
+        # If we get here, safe zone completed without interruption
+        if self.is_waiting and self.pending_backchannel:
+            task = asyncio.create_task(self.proceed_to_playback())
+            self._playback_tasks.add(task)
+            task.add_done_callback(self._playback_tasks.discard)
     
     async def abort_backchannel(self) -> None:
         """Abort pending backchannel."""
         backchannel_type = self.pending_backchannel
         
         # Cancel timer
-        if self.safe_zone_task:
-            self.safe_zone_task.cancel()
-            try:
-                await self.safe_zone_task
-            except asyncio.CancelledError:
-                pass
+        if self.safe_zone_handle:
+            self.safe_zone_handle.cancel()
         
         # Clear state
         self.pending_backchannel = None
         self.is_waiting = False
-        self.safe_zone_task = None
+        self.safe_zone_handle = None
         
         # Emit abort event
         await event_bus.emit(EventType.BACKCHANNEL_ABORTED, {
@@ -116,11 +118,11 @@ class BackchannelTimingController:
         # Clear state
         self.pending_backchannel = None
         self.is_waiting = False
-        self.safe_zone_task = None
+        self.safe_zone_handle = None
         
         # Emit playback event (for player)
         # We reuse BACKCHANNEL_TRIGGERED but with a "proceed" flag
-        await event_bus.emit(EventType.BACKCHANNEL_TRIGGERED, {
-            "backchannel_type": backchannel_type,
-            "proceed_to_play": True
-        })
+        await event_bus.emit(EventType.BACKCHANNEL_TRIGGERED, BackchannelPayload(
+            backchannel_type=backchannel_type,
+            proceed_to_play=True
+        ))
@@ -1,12 +1,20 @@
 """Backchannel trigger detection."""
 import random
-from typing import Optional
+import re
+from typing import NamedTuple, Optional, Tuple
 
 from .config import config
-from .event_bus import event_bus, EventType, Event
+from .event_bus import event_bus, EventType, Event, BackchannelPayload
 from .conversation_manager import ConversationManager, ConversationState
 
 
+class TranscriptFlags(NamedTuple):
+    """Transcript features used by the probability modifiers."""
+    has_emotion: bool
+    has_prompt: bool
+    ends_sentence: bool
+
+
 class BackchannelTriggerDetector:
     """
     Detects when to trigger backchannels.
@@ -36,11 +44,19 @@ class BackchannelTriggerDetector:
         self.short_pause_ms = config.short_pause_ms
         
         # Keywords
-        self.emotion_keywords = set(word.lower() for word in config.emotion_keywords)
+        self.emotion_keywords = frozenset(word.lower() for word in config.emotion_keywords)
         self.explicit_prompts = [phrase.lower() for phrase in config.explicit_prompts]
         
+        # Prompt phrases compiled into one pattern (they match anywhere);
+        # emotion words are whole tokens, looked up in the frozenset
+        self._prompt_pattern = self._compile_prompt_pattern()
+        
+        # Silence duration at the last full evaluation (debounce)
+        self._last_eval_ms = 0.0
+        
         # Subscribe to events
         event_bus.subscribe(EventType.SILENCE_DETECTED, self.on_silence_detected)
+        event_bus.subscribe(EventType.SPEECH_STARTED, self.on_speech_started)
         event_bus.subscribe(EventType.PARTIAL_TRANSCRIPT, self.on_partial_transcript)
     
     async def on_silence_detected(self, event: Event) -> None:
@@ -60,10 +76,19 @@ class BackchannelTriggerDetector:
         # Make decision
         if random.random() < probability:
             # Trigger backchannel
-            await event_bus.emit(EventType.BACKCHANNEL_TRIGGERED, {
-                "trigger_strength": probability,
-                "silence_duration_ms": event.data.get("silence_duration_ms", 0)
-            })
+            await event_bus.emit(EventType.BACKCHANNEL_TRIGGERED, BackchannelPayload(
+                trigger_strength=probability,
+                silence_duration_ms=event.data.get("silence_duration_ms", 0)
+            ))
+    
+    async def on_speech_started(self, event: Event) -> None:
+        """
+        Reset the silence debounce when the user speaks again.
+        
+        Args:
+            event: SPEECH_STARTED event
+        """
+        self._last_eval_ms = 0.0
     
     async def on_partial_transcript(self, event: Event) -> None:
         """
@@ -86,16 +111,23 @@ class BackchannelTriggerDetector:
         Returns:
             True if conditions met
         """
-        # 1. Current state must be USER_SPEAKING
-        state = self.conversation_manager.get_state()
-        if state != ConversationState.USER_SPEAKING:
-            return False
-        
-        # 2. Silence duration in short pause range (300-700ms)
+        # 1. Silence duration in short pause range (300-700ms)
+        # Checked first: it rejects most per-frame silence events cheaply
         silence_duration_ms = event.data.get("silence_duration_ms", 0)
         if not (300 <= silence_duration_ms <= 700):
             return False
         
+        # Debounce: at most one full evaluation per 50ms of silence
+        # (a new pause has a shorter duration and is always evaluated)
+        if 0 <= silence_duration_ms - self._last_eval_ms < 50:
+            return False
+        self._last_eval_ms = silence_duration_ms
+        
+        # 2. Current state must be USER_SPEAKING
+        state = self.conversation_manager.get_state()
+        if state != ConversationState.USER_SPEAKING:
+            return False
+        
         # 3. At least 5 seconds since last backchannel
         context = self.conversation_manager.get_context()
         time_since_last = context.get_time_since_last_backchannel()
@@ -123,14 +155,14 @@ class BackchannelTriggerDetector:
         prob = self.base_probability
         
         context = self.conversation_manager.get_context()
-        transcript = self.conversation_manager.get_user_transcript_current_turn().lower()
+        flags = self._analyze(self.conversation_manager.get_user_transcript_current_turn_lower())
         
         # Modifier: emotion keywords
-        if self.detect_emotion_keywords(transcript):
+        if flags.has_emotion:
             prob += 0.3
         
         # Modifier: explicit prompts ("you know?", "right?")
-        if self.detect_explicit_prompts(transcript):
+        if flags.has_prompt:
             prob += 0.5
         
         # Modifier: just played backchannel recently
@@ -144,34 +176,47 @@ class BackchannelTriggerDetector:
             prob -= 0.3
         
         # Modifier: pause after complete sentence (ends with punctuation)
-        if transcript.rstrip().endswith(('.', '!', '?')):
+        if flags.ends_sentence:
             prob += 0.2
         
         # Clamp to [0, 1]
         return max(0.0, min(1.0, prob))
     
-    def detect_emotion_keywords(self, text: str) -> bool:
+    def _analyze(self, transcript_lower: str) -> TranscriptFlags:
         """
-        Detect emotion keywords in text.
+        Compute all transcript flags in one pass.
         
         Args:
-            text: Text to analyze
+            transcript_lower: Lowercased current-turn transcript
         
         Returns:
-            True if emotion keywords found
+            TranscriptFlags for the transcript
         """
-        words = set(text.lower().split())
-        return bool(words & self.emotion_keywords)
+        text = transcript_lower.rstrip()
+        has_emotion, has_prompt = self._scan_keywords(text)
+        return TranscriptFlags(has_emotion, has_prompt, text.endswith(('.', '!', '?')))
+    
+    def _compile_prompt_pattern(self) -> re.Pattern:
+        """Build the explicit prompt pattern."""
+        if not self.explicit_prompts:
+            # Never matches
+            return re.compile("(?!)")
+        
+        # Longest first so overlapping phrases prefer the full match
+        phrases = sorted(set(self.explicit_prompts), key=len, reverse=True)
+        return re.compile("|".join(re.escape(phrase) for phrase in phrases))
     
-    def detect_explicit_prompts(self, text: str) -> bool:
+    def _scan_keywords(self, text: str) -> Tuple[bool, bool]:
         """
-        Detect explicit prompts in text.
+        Detect emotion keywords and explicit prompts in one pass.
         
         Args:
-            text: Text to analyze
+            text: Lowercased text to analyze
         
         Returns:
-            True if explicit prompts found
+            Tuple of (has_emotion_keyword, has_explicit_prompt)
         """
-        text_lower = text.lower()
-        return any(prompt in text_lower for prompt in self.explicit_prompts)
+        # isdisjoint stops at the first token found in the set
+        has_emotion = not self.emotion_keywords.isdisjoint(text.split())
+        has_prompt = self._prompt_pattern.search(text) is not None
+        return has_emotion, has_prompt
@@ -1,112 +1,181 @@
 """Configuration management for the voice agent system."""
+import json
 import os
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import List, Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field, field_validator
+from typing import Any, Dict, List, Optional, Union, get_args, get_origin
+from dotenv import dotenv_values
 
 
-class Config(BaseSettings):
-    """Central configuration for all voice agent components."""
+def _parse_env_value(raw: str, field_type: Any) -> Any:
+    """
+    Convert an environment string to a config field's type.
+    
+    Args:
+        raw: Raw environment value
+        field_type: Annotated type of the field
+    
+    Returns:
+        Converted value
+    """
+    # Optional[X] -> X
+    if get_origin(field_type) is Union:
+        field_type = next(t for t in get_args(field_type) if t is not type(None))
+    
+    # Lists are given as JSON arrays, e.g. '["and", "so"]'
+    if get_origin(field_type) in (list, List):
+        return json.loads(raw)
+    
+    return field_type(raw)
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Central configuration for all voice agent components.
+    
+    Every field can be overridden by the environment variable of the same
+    name (case-insensitive), or by a .env file; see from_env().
+    """
     
     # API Keys
-    openai_api_key: str = Field(default="", env="OPENAI_API_KEY")
+    openai_api_key: str = ""
     
     # Server Settings
-    host: str = Field(default="0.0.0.0", env="HOST")
-    port: int = Field(default=8000, env="PORT")
+    host: str = "0.0.0.0"
+    port: int = 8000
     
     # Audio Settings
-    sample_rate: int = Field(default=16000, env="SAMPLE_RATE")
-    channels: int = Field(default=1, env="CHANNELS")
-    chunk_duration_ms: int = Field(default=30, env="CHUNK_DURATION_MS")
-    whisper_chunk_duration_s: float = Field(default=1.5, env="WHISPER_CHUNK_DURATION_S")
-    whisper_overlap_s: float = Field(default=0.5, env="WHISPER_OVERLAP_S")
+    sample_rate: int = 16000
+    channels: int = 1
+    chunk_duration_ms: int = 30
+    whisper_chunk_duration_s: float = 1.5
+    whisper_overlap_s: float = 0.5
+    webrtc_rx_batch_ms: int = 40  # received audio handed to the pipeline per await (<= 20 disables)
     
     # VAD Settings
-    vad_threshold: float = Field(default=0.5, env="VAD_THRESHOLD")
-    vad_min_speech_duration_ms: int = Field(default=250, env="VAD_MIN_SPEECH_DURATION_MS")
-    vad_min_silence_duration_ms: int = Field(default=300, env="VAD_MIN_SILENCE_DURATION_MS")
-    vad_speech_pad_ms: int = Field(default=30, env="VAD_SPEECH_PAD_MS")
+    vad_threshold: float = 0.5
+    vad_min_speech_duration_ms: int = 250
+    vad_min_silence_duration_ms: int = 300
+    vad_speech_pad_ms: int = 30
+    
+    # STT Request Scheduling
+    stt_max_concurrent_requests: int = 8
+    stt_batch_window_ms: int = 75
     
     # Turn Detection Thresholds
-    short_pause_ms: int = Field(default=400, env="SHORT_PAUSE_MS")
-    medium_pause_ms: int = Field(default=1000, env="MEDIUM_PAUSE_MS")
-    long_pause_ms: int = Field(default=1500, env="LONG_PAUSE_MS")
-    turn_end_score_threshold: int = Field(default=65, env="TURN_END_SCORE_THRESHOLD")
+    short_pause_ms: int = 400
+    medium_pause_ms: int = 1000
+    long_pause_ms: int = 1500
+    turn_end_score_threshold: int = 65
     
     # Scoring Weights (must sum to 1.0)
-    silence_weight: float = Field(default=0.4, env="SILENCE_WEIGHT")
-    linguistic_weight: float = Field(default=0.35, env="LINGUISTIC_WEIGHT")
-    context_weight: float = Field(default=0.25, env="CONTEXT_WEIGHT")
+    silence_weight: float = 0.4
+    linguistic_weight: float = 0.35
+    context_weight: float = 0.25
     
     # Backchannel Settings
-    backchannel_base_probability: float = Field(default=0.4, env="BACKCHANNEL_BASE_PROBABILITY")
-    backchannel_min_interval_s: float = Field(default=5.0, env="BACKCHANNEL_MIN_INTERVAL_S")
-    backchannel_safe_zone_ms: int = Field(default=300, env="BACKCHANNEL_SAFE_ZONE_MS")
-    backchannel_volume: float = Field(default=0.5, env="BACKCHANNEL_VOLUME")
+    backchannel_base_probability: float = 0.4
+    backchannel_min_interval_s: float = 5.0
+    backchannel_safe_zone_ms: int = 300
+    backchannel_volume: float = 0.5
+    
+    # Conversation History
+    max_transcript_segments: int = 1000
     
     # Continuation Words
-    continuation_words: List[str] = Field(
-        default=["and", "so", "but", "um", "uh", "like", "or", "because", 
+    continuation_words: List[str] = field(
+        default_factory=lambda: ["and", "so", "but", "um", "uh", "like", "or", "because", 
                  "then", "well", "actually", "basically", "you know"]
     )
     
     # Emotion Keywords (for backchannel triggering)
-    emotion_keywords: List[str] = Field(
-        default=["amazing", "terrible", "wonderful", "awful", "excited", 
+    emotion_keywords: List[str] = field(
+        default_factory=lambda: ["amazing", "terrible", "wonderful", "awful", "excited", 
                  "frustrated", "happy", "sad", "angry", "love", "hate"]
     )
     
     # Explicit Prompt Phrases
-    explicit_prompts: List[str] = Field(
-        default=["you know?", "right?", "don't you think?", "isn't it?", 
+    explicit_prompts: List[str] = field(
+        default_factory=lambda: ["you know?", "right?", "don't you think?", "isn't it?", 
                  "you see?", "understand?", "make sense?"]
     )
     
     # LLM Settings
-    llm_model: str = Field(default="gpt-4o-mini", env="LLM_MODEL")
-    llm_max_tokens: int = Field(default=150, env="LLM_MAX_TOKENS")
-    llm_temperature: float = Field(default=0.7, env="LLM_TEMPERATURE")
+    llm_model: str = "gpt-4o-mini"
+    llm_max_tokens: int = 150
+    llm_temperature: float = 0.7
     
     # TTS Settings
-    tts_voice: str = Field(default="alloy", env="TTS_VOICE")
-    tts_model: str = Field(default="tts-1", env="TTS_MODEL")
+    tts_voice: str = "alloy"
+    tts_model: str = "tts-1"
+    tts_cache_size: int = 128  # synthesized phrases kept in memory (0 disables)
     
     # Paths
-    base_dir: Path = Field(default_factory=lambda: Path(__file__).parent.parent)
-    backchannel_dir: Optional[Path] = Field(default=None)
-    vad_model_path: Optional[Path] = Field(default=None)
-    
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": False,
-    }
-    
-    def model_post_init(self, __context) -> None:
-        """Initialize paths after model validation."""
-        # Set default paths relative to base_dir
+    base_dir: Path = field(default_factory=lambda: Path(__file__).parent.parent)
+    backchannel_dir: Optional[Path] = None
+    vad_model_path: Optional[Path] = None
+    
+    # Derived sample counts (computed in __post_init__, not configurable)
+    chunk_size_samples: int = field(init=False, default=0)
+    whisper_chunk_size_samples: int = field(init=False, default=0)
+    whisper_overlap_samples: int = field(init=False, default=0)
+    
+    def __post_init__(self) -> None:
+        """Fill in default paths and validate ranges."""
+        # Set default paths relative to base_dir (frozen, so bypass __setattr__)
         if self.backchannel_dir is None:
-            self.backchannel_dir = self.base_dir / "backchannels"
+            object.__setattr__(self, "backchannel_dir", self.base_dir / "backchannels")
         if self.vad_model_path is None:
-            self.vad_model_path = self.base_dir / "models" / "silero_vad.onnx"
-    
-    @field_validator("silence_weight", "linguistic_weight", "context_weight")
-    @classmethod
-    def validate_weights(cls, v):
-        """Ensure weights are between 0 and 1."""
-        if not 0 <= v <= 1:
-            raise ValueError(f"Weight must be between 0 and 1, got {v}")
-        return v
+            object.__setattr__(self, "vad_model_path", self.base_dir / "models" / "silero_vad.onnx")
+        
+        # Precompute sample counts once
+        object.__setattr__(self, "chunk_size_samples", int(self.sample_rate * self.chunk_duration_ms / 1000))
+        object.__setattr__(self, "whisper_chunk_size_samples", int(self.sample_rate * self.whisper_chunk_duration_s))
+        object.__setattr__(self, "whisper_overlap_samples", int(self.sample_rate * self.whisper_overlap_s))
+        
+        # Ensure weights are between 0 and 1
+        for name in ("silence_weight", "linguistic_weight", "context_weight"):
+            v = getattr(self, name)
+            if not 0 <= v <= 1:
+                raise ValueError(f"Weight must be between 0 and 1, got {v}")
+        
+        # Ensure probability values are between 0 and 1
+        for name in ("vad_threshold", "backchannel_base_probability", "backchannel_volume"):
+            v = getattr(self, name)
+            if not 0 <= v <= 1:
+                raise ValueError(f"Probability must be between 0 and 1, got {v}")
+        
+        # Need at least one STT request slot
+        if self.stt_max_concurrent_requests < 1:
+            raise ValueError(
+                f"stt_max_concurrent_requests must be at least 1, got {self.stt_max_concurrent_requests}"
+            )
     
-    @field_validator("vad_threshold", "backchannel_base_probability", "backchannel_volume")
     @classmethod
-    def validate_probability(cls, v):
-        """Ensure probability values are between 0 and 1."""
-        if not 0 <= v <= 1:
-            raise ValueError(f"Probability must be between 0 and 1, got {v}")
-        return v
+    def from_env(cls, env_file: str = ".env") -> "Config":
+        """
+        Build config from the environment in one pass.
+        
+        Args:
+            env_file: Optional dotenv file; real environment variables win
+        
+        Returns:
+            Config instance
+        """
+        env: Dict[str, str] = {
+            key.lower(): value
+            for key, value in dotenv_values(env_file).items()
+            if value is not None
+        }
+        env.update((key.lower(), value) for key, value in os.environ.items())
+        
+        overrides = {
+            f.name: _parse_env_value(env[f.name], f.type)
+            for f in fields(cls)
+            if f.init and f.name in env
+        }
+        return cls(**overrides)
     
     def validate_all(self) -> bool:
         """Validate all configuration values."""
@@ -130,16 +199,16 @@ class Config(BaseSettings):
     
     def get_chunk_size_samples(self) -> int:
         """Get the number of samples per VAD chunk."""
-        return int(self.sample_rate * self.chunk_duration_ms / 1000)
+        return self.chunk_size_samples
     
     def get_whisper_chunk_size_samples(self) -> int:
         """Get the number of samples per Whisper chunk."""
-        return int(self.sample_rate * self.whisper_chunk_duration_s)
+        return self.whisper_chunk_size_samples
     
     def get_whisper_overlap_samples(self) -> int:
         """Get the number of samples for Whisper overlap."""
-        return int(self.sample_rate * self.whisper_overlap_s)
+        return self.whisper_overlap_samples
 
 
 # Global config instance
-config = Config()
+config = Config.from_env()
@@ -1,9 +1,15 @@
 """Conversation state management - single source of truth."""
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from itertools import islice
+from typing import Deque, List, Optional, Tuple
 import asyncio
+import time
+
+from .config import config
+from .linguistic_analyzer import count_sentence_marks
 
 
 class ConversationState(Enum):
@@ -15,7 +21,7 @@ class ConversationState(Enum):
     AGENT_SPEAKING = "agent_speaking"
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     """A segment of transcribed speech."""
     text: str
@@ -28,7 +34,7 @@ class TranscriptSegment:
         return f"{self.speaker.upper()} {final_marker}: {self.text}"
 
 
-@dataclass
+@dataclass(slots=True)
 class BackchannelEvent:
     """Record of a backchannel event."""
     type: str  # backchannel name (e.g., "mmhmm")
@@ -40,23 +46,26 @@ class BackchannelEvent:
         return f"{status} {self.type} @ {self.timestamp.isoformat()}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationContext:
     """Complete conversation state."""
     # Current state
     state: ConversationState = ConversationState.IDLE
     
-    # Timing
-    current_user_speech_start: Optional[datetime] = None
-    current_silence_start: Optional[datetime] = None
+    # Timing (time.monotonic() seconds; never shown as wall-clock)
+    current_user_speech_start: Optional[float] = None
+    current_silence_start: Optional[float] = None
     current_silence_duration: float = 0.0  # seconds
     
     # Transcription
     partial_transcript: str = ""
-    transcript_segments: List[TranscriptSegment] = field(default_factory=list)
+    # Bounded history: oldest segments drop off in long sessions
+    transcript_segments: Deque[TranscriptSegment] = field(
+        default_factory=lambda: deque(maxlen=config.max_transcript_segments)
+    )
     
     # Backchannel tracking
-    last_backchannel_time: Optional[datetime] = None
+    last_backchannel_time: Optional[float] = None  # time.monotonic()
     backchannel_history: List[BackchannelEvent] = field(default_factory=list)
     
     # User behavior learning
@@ -69,20 +78,20 @@ class ConversationContext:
     
     def get_user_speaking_duration(self) -> float:
         """Get duration of current user speech in seconds."""
-        if self.current_user_speech_start:
-            return (datetime.now() - self.current_user_speech_start).total_seconds()
+        if self.current_user_speech_start is not None:
+            return time.monotonic() - self.current_user_speech_start
         return 0.0
     
     def get_silence_duration(self) -> float:
         """Get duration of current silence in seconds."""
-        if self.current_silence_start:
-            return (datetime.now() - self.current_silence_start).total_seconds()
+        if self.current_silence_start is not None:
+            return time.monotonic() - self.current_silence_start
         return 0.0
     
     def get_time_since_last_backchannel(self) -> float:
         """Get seconds since last backchannel."""
-        if self.last_backchannel_time:
-            return (datetime.now() - self.last_backchannel_time).total_seconds()
+        if self.last_backchannel_time is not None:
+            return time.monotonic() - self.last_backchannel_time
         return float('inf')
 
 
@@ -90,6 +99,10 @@ class ConversationManager:
     """
     Manages conversation state and history.
     Single source of truth for all conversation data.
+    
+    Writers take the lock; get_* readers never do. Shared state that
+    readers touch is replaced by single assignments (immutable tuples,
+    ints), so a reader always sees either the old or the new value.
     """
     
     def __init__(self, event_bus):
@@ -102,6 +115,18 @@ class ConversationManager:
         self.context = ConversationContext()
         self.event_bus = event_bus
         self._lock = asyncio.Lock()
+        
+        # Final user segments since the last agent segment (immutable
+        # snapshot, replaced on write), plus lazily joined/lowercased views
+        # (invalidated in add_transcript)
+        self._current_turn_parts: Tuple[str, ...] = ()
+        self._current_turn_cache: Optional[str] = None
+        self._current_turn_lower_cache: Optional[str] = None
+        
+        # Absolute segment positions (the history deque drops old entries):
+        # total segments ever appended, and where the current turn starts
+        self._segments_appended = 0
+        self._turn_start = 0
     
     async def update_state(self, new_state: ConversationState) -> None:
         """
@@ -113,14 +138,15 @@ class ConversationManager:
         async with self._lock:
             old_state = self.context.state
             self.context.state = new_state
-            
-            # Emit state change event
-            from .event_bus import EventType
-            await self.event_bus.emit(EventType.STATE_CHANGED, {
-                "old_state": old_state.value,
-                "new_state": new_state.value,
-                "timestamp": datetime.now()
-            })
+        
+        # Emit state change event outside the lock so subscribers never
+        # hold up (or deadlock against) other state updates
+        from .event_bus import EventType
+        await self.event_bus.emit(EventType.STATE_CHANGED, {
+            "old_state": old_state.value,
+            "new_state": new_state.value,
+            "timestamp": datetime.now()
+        })
     
     def get_state(self) -> ConversationState:
         """Get current conversation state."""
@@ -135,25 +161,39 @@ class ConversationManager:
             is_final: Whether this is a final transcription
             speaker: "user" or "agent"
         """
+        # Build everything outside the lock; only the mutation is guarded
+        segment = TranscriptSegment(
+            text=text,
+            timestamp=datetime.now(),
+            is_final=is_final,
+            speaker=speaker
+        )
+        
+        if speaker == "user" and is_final:
+            # Update word and sentence counts
+            word_count = len(text.split())
+            # Simple sentence count (periods, question marks, exclamation marks)
+            sentence_count = max(1, count_sentence_marks(text))
+        
         async with self._lock:
-            segment = TranscriptSegment(
-                text=text,
-                timestamp=datetime.now(),
-                is_final=is_final,
-                speaker=speaker
-            )
             self.context.transcript_segments.append(segment)
+            self._segments_appended += 1
+            
+            # Keep the current-turn view in step with the segment list
+            if speaker == "agent":
+                self._turn_start = self._segments_appended
+                self._current_turn_parts = ()
+                self._invalidate_current_turn()
+            elif is_final:
+                self._current_turn_parts = self._current_turn_parts + (text,)
+                self._invalidate_current_turn()
             
             # Update partial transcript for user
             if speaker == "user":
                 if is_final:
                     self.context.partial_transcript = ""
-                    # Update word and sentence counts
-                    words = text.split()
-                    self.context.user_word_count_current_turn += len(words)
-                    # Simple sentence count (periods, question marks, exclamation marks)
-                    sentences = text.count('.') + text.count('?') + text.count('!')
-                    self.context.user_sentence_count_current_turn += max(1, sentences)
+                    self.context.user_word_count_current_turn += word_count
+                    self.context.user_sentence_count_current_turn += sentence_count
                 else:
                     self.context.partial_transcript = text
     
@@ -165,14 +205,15 @@ class ConversationManager:
             backchannel_type: Type of backchannel (e.g., "mmhmm")
             was_successful: Whether user continued speaking after
         """
+        event = BackchannelEvent(
+            type=backchannel_type,
+            timestamp=datetime.now(),
+            was_successful=was_successful
+        )
+        
         async with self._lock:
-            event = BackchannelEvent(
-                type=backchannel_type,
-                timestamp=datetime.now(),
-                was_successful=was_successful
-            )
             self.context.backchannel_history.append(event)
-            self.context.last_backchannel_time = event.timestamp
+            self.context.last_backchannel_time = time.monotonic()
     
     async def reset_turn(self) -> None:
         """Reset turn-specific state."""
@@ -194,7 +235,8 @@ class ConversationManager:
         Returns:
             List of recent transcript segments
         """
-        return self.context.transcript_segments[-n:]
+        segments = self.context.transcript_segments
+        return list(islice(segments, max(0, len(segments) - n), None))
     
     def get_full_conversation(self) -> str:
         """
@@ -210,28 +252,70 @@ class ConversationManager:
                 lines.append(f"{prefix} {segment.text}")
         return "\n".join(lines)
     
-    def get_user_transcript_current_turn(self) -> str:
-        """Get all user text from current turn."""
-        # Get all final user segments since last agent response
-        user_segments = []
+    def get_recent_turns(self, n: int = 10) -> List[Tuple[str, str]]:
+        """
+        Get the last N final segments as chat roles.
+        
+        Args:
+            n: Number of segments to retrieve
+        
+        Returns:
+            List of (role, text) pairs, role "user" or "assistant", oldest first
+        """
+        turns: List[Tuple[str, str]] = []
+        if n <= 0:
+            return turns
+        
+        # Walk back from the newest segment and stop once we have enough
         for segment in reversed(self.context.transcript_segments):
-            if segment.speaker == "agent":
-                break
-            if segment.speaker == "user" and segment.is_final:
-                user_segments.insert(0, segment.text)
+            if segment.is_final:
+                role = "user" if segment.speaker == "user" else "assistant"
+                turns.append((role, segment.text))
+                if len(turns) == n:
+                    break
+        
+        turns.reverse()
+        return turns
+    
+    def get_current_turn_segments(self) -> List[TranscriptSegment]:
+        """
+        Get all segments since the last agent segment.
         
-        return " ".join(user_segments)
+        Returns:
+            Segments of the current turn (oldest first)
+        """
+        segments = self.context.transcript_segments
+        in_turn = self._segments_appended - self._turn_start
+        return list(islice(segments, max(0, len(segments) - in_turn), None))
+    
+    def get_user_transcript_current_turn(self) -> str:
+        """Get all user text from current turn."""
+        # Final user segments since last agent response, joined on demand
+        if self._current_turn_cache is None:
+            self._current_turn_cache = " ".join(self._current_turn_parts)
+        return self._current_turn_cache
+    
+    def get_user_transcript_current_turn_lower(self) -> str:
+        """Get all user text from current turn, lowercased."""
+        if self._current_turn_lower_cache is None:
+            self._current_turn_lower_cache = self.get_user_transcript_current_turn().lower()
+        return self._current_turn_lower_cache
+    
+    def _invalidate_current_turn(self) -> None:
+        """Drop cached current-turn transcripts."""
+        self._current_turn_cache = None
+        self._current_turn_lower_cache = None
     
     async def start_user_speech(self) -> None:
         """Mark start of user speech."""
         async with self._lock:
-            self.context.current_user_speech_start = datetime.now()
+            self.context.current_user_speech_start = time.monotonic()
             self.context.current_silence_start = None
     
     async def start_silence(self) -> None:
         """Mark start of silence."""
         async with self._lock:
-            self.context.current_silence_start = datetime.now()
+            self.context.current_silence_start = time.monotonic()
     
     async def update_silence_duration(self, duration: float) -> None:
         """Update current silence duration."""
@@ -1,56 +1,114 @@
 """Event bus system for component communication."""
 import asyncio
-from collections import defaultdict, deque
+import time
 from datetime import datetime
-from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 import inspect
+import logging
 
+logger = logging.getLogger(__name__)
 
-class EventType(Enum):
-    """All event types in the system."""
+
+class EventType(IntEnum):
+    """
+    All event types in the system.
+    
+    Int-valued so subscriber dict lookups use int hashing; use .label
+    for the readable name in logs.
+    """
     # Audio events
-    AUDIO_CHUNK_RECEIVED = "audio_chunk_received"
+    AUDIO_CHUNK_RECEIVED = 1
     
     # VAD events
-    SPEECH_STARTED = "speech_started"
-    SPEECH_CONTINUING = "speech_continuing"
-    SILENCE_DETECTED = "silence_detected"
-    SPEECH_ENDED = "speech_ended"
+    SPEECH_STARTED = 2
+    SPEECH_CONTINUING = 3
+    SILENCE_DETECTED = 4
+    SPEECH_ENDED = 5
     
     # Transcription events
-    PARTIAL_TRANSCRIPT = "partial_transcript"
-    FINAL_TRANSCRIPT = "final_transcript"
+    PARTIAL_TRANSCRIPT = 6
+    FINAL_TRANSCRIPT = 7
     
     # Turn detection events
-    TURN_EVALUATION = "turn_evaluation"
-    TURN_ENDED = "turn_ended"
+    TURN_EVALUATION = 8
+    TURN_ENDED = 9
     
     # Backchannel events
-    BACKCHANNEL_TRIGGERED = "backchannel_triggered"
-    BACKCHANNEL_PLAYED = "backchannel_played"
-    BACKCHANNEL_ABORTED = "backchannel_aborted"
+    BACKCHANNEL_TRIGGERED = 10
+    BACKCHANNEL_PLAYED = 11
+    BACKCHANNEL_ABORTED = 12
     
     # Response events
-    RESPONSE_GENERATING = "response_generating"
-    RESPONSE_STARTED = "response_started"
-    RESPONSE_CHUNK = "response_chunk"
-    RESPONSE_ENDED = "response_ended"
+    RESPONSE_GENERATING = 13
+    RESPONSE_STARTED = 14
+    RESPONSE_CHUNK = 15
+    RESPONSE_ENDED = 16
     
     # State events
-    STATE_CHANGED = "state_changed"
+    STATE_CHANGED = 17
+    
+    @property
+    def label(self) -> str:
+        """Readable event name (e.g. "speech_started")."""
+        return self.name.lower()
+
+
+@dataclass(slots=True, frozen=True)
+class BackchannelPayload:
+    """
+    Data of BACKCHANNEL_TRIGGERED events.
+    
+    One event type carries three stages of the backchannel chain:
+    - trigger detected: backchannel_type is None
+    - type selected: backchannel_type set, proceed_to_play False
+    - safe zone passed: proceed_to_play True
+    """
+    backchannel_type: Optional[str] = None
+    trigger_strength: float = 0.4
+    silence_duration_ms: float = 0
+    proceed_to_play: bool = False
+
+
+# Event types kept in history even when nobody subscribes to them.
+# High-rate per-frame events (audio chunks, speech continuing, response
+# chunks, turn evaluation) are left out so they cost nothing when unused.
+_HISTORY_EVENTS = frozenset({
+    EventType.SPEECH_STARTED,
+    EventType.SILENCE_DETECTED,
+    EventType.SPEECH_ENDED,
+    EventType.PARTIAL_TRANSCRIPT,
+    EventType.FINAL_TRANSCRIPT,
+    EventType.TURN_ENDED,
+    EventType.BACKCHANNEL_TRIGGERED,
+    EventType.BACKCHANNEL_PLAYED,
+    EventType.BACKCHANNEL_ABORTED,
+    EventType.RESPONSE_GENERATING,
+    EventType.RESPONSE_STARTED,
+    EventType.RESPONSE_ENDED,
+    EventType.STATE_CHANGED,
+})
+
+
+# Offset from time.monotonic() to wall-clock epoch seconds, fixed at import
+_WALL_CLOCK_OFFSET = time.time() - time.monotonic()
 
 
 @dataclass
 class Event:
     """Event data structure."""
     event_type: EventType
-    data: Dict[str, Any]
-    timestamp: datetime = field(default_factory=datetime.now)
+    data: Union[Dict[str, Any], BackchannelPayload]
+    timestamp: float = field(default_factory=time.monotonic)  # time.monotonic()
+    
+    @property
+    def wall_time(self) -> datetime:
+        """Wall-clock time of the event (for display)."""
+        return datetime.fromtimestamp(self.timestamp + _WALL_CLOCK_OFFSET)
     
     def __repr__(self) -> str:
-        return f"Event({self.event_type.value}, {self.timestamp.isoformat()})"
+        return f"Event({self.event_type.label}, {self.timestamp:.3f})"
 
 
 class EventBus:
@@ -61,7 +119,10 @@ class EventBus:
     - Async event emission
     - Support for both sync and async callbacks
     - Event history for debugging
-    - Thread-safe operations
+    
+    The bus is loop-affine: emit() must run on the event loop that owns it
+    (it is not thread-safe, and needs no lock there). Other threads use
+    emit_sync(), which hands the event over to that loop.
     """
     
     def __init__(self, history_size: int = 100):
@@ -71,20 +132,34 @@ class EventBus:
         Args:
             history_size: Number of events to keep in history
         """
-        self._subscribers: Dict[EventType, List[Callable]] = defaultdict(list)
-        self._history: deque = deque(maxlen=history_size)
-        self._lock = asyncio.Lock()
+        # Subscribers as (callback, is_async, blocking); kind is resolved once
+        # at subscribe time. Tuples are rebuilt on (un)subscribe, so emit
+        # can iterate them without copying.
+        self._subscribers: Dict[EventType, Tuple[Tuple[Callable, bool, bool], ...]] = {}
+        # History ring: fixed slots, overwritten in place once full
+        self._history_size = history_size
+        self._history: List[Optional[Event]] = [None] * history_size
+        self._history_idx = 0  # total events recorded; next slot is idx % size
+        
+        # Loop that owns the bus, captured on the first emit
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # emit_sync tasks, kept alive until they finish
+        self._pending_emits: Set[asyncio.Task] = set()
     
-    def subscribe(self, event_type: EventType, callback: Callable) -> None:
+    def subscribe(self, event_type: EventType, callback: Callable, blocking: bool = False) -> None:
         """
         Subscribe to an event type.
         
         Args:
             event_type: Type of event to subscribe to
             callback: Function to call when event is emitted (can be sync or async)
+            blocking: Sync callback may block; run it in a worker thread
         """
-        if callback not in self._subscribers[event_type]:
-            self._subscribers[event_type].append(callback)
+        subscribers = self._subscribers.get(event_type, ())
+        if all(entry[0] != callback for entry in subscribers):
+            entry = (callback, inspect.iscoroutinefunction(callback), blocking)
+            self._subscribers[event_type] = subscribers + (entry,)
     
     def unsubscribe(self, event_type: EventType, callback: Callable) -> None:
         """
@@ -94,58 +169,94 @@ class EventBus:
             event_type: Type of event to unsubscribe from
             callback: Function to remove
         """
-        if callback in self._subscribers[event_type]:
-            self._subscribers[event_type].remove(callback)
+        subscribers = self._subscribers.get(event_type)
+        if subscribers is None:
+            return
+        
+        remaining = tuple(entry for entry in subscribers if entry[0] != callback)
+        if remaining:
+            self._subscribers[event_type] = remaining
+        else:
+            # Drop the key so unused event types don't linger in the dict
+            del self._subscribers[event_type]
     
-    async def emit(self, event_type: EventType, data: Optional[Dict[str, Any]] = None) -> None:
+    async def emit(
+        self,
+        event_type: EventType,
+        data: Optional[Union[Dict[str, Any], BackchannelPayload]] = None
+    ) -> None:
         """
         Emit an event to all subscribers.
         
         Args:
             event_type: Type of event to emit
-            data: Event data dictionary
+            data: Event data dictionary (or BackchannelPayload)
         """
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        
+        subscribers = self._subscribers.get(event_type)
+        
+        # Fast path: nobody listening and not worth keeping in history
+        if not subscribers and event_type not in _HISTORY_EVENTS:
+            return
+        
         if data is None:
             data = {}
         
         event = Event(event_type=event_type, data=data)
         
         # Add to history
-        async with self._lock:
-            self._history.append(event)
+        if self._history_size:
+            self._history[self._history_idx % self._history_size] = event
+            self._history_idx += 1
         
-        # Call all subscribers
-        subscribers = self._subscribers[event_type].copy()
+        if not subscribers:
+            return
         
-        for callback in subscribers:
+        # Call all subscribers (immutable snapshot: subscribing during
+        # dispatch only affects later events)
+        for callback, is_async, blocking in subscribers:
             try:
-                # Check if callback is async
-                if inspect.iscoroutinefunction(callback):
+                if is_async:
                     await callback(event)
+                elif blocking:
+                    # Only callbacks flagged as blocking leave the loop
+                    await asyncio.to_thread(callback, event)
                 else:
-                    # Run sync callback in executor to avoid blocking
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, callback, event)
+                    # Plain state updates: a direct call is cheapest
+                    callback(event)
             except Exception as e:
-                print(f"Error in event callback for {event_type.value}: {e}")
+                logger.error("Error in event callback for %s: %s", event_type.label, e)
     
     def emit_sync(self, event_type: EventType, data: Optional[Dict[str, Any]] = None) -> None:
         """
-        Synchronous emit (creates task in event loop).
+        Fire-and-forget emit from sync code, on the loop or another thread.
         
         Args:
             event_type: Type of event to emit
             data: Event data dictionary
+        
+        Raises:
+            RuntimeError: If the bus has not emitted on an event loop yet
         """
+        loop = self._loop
+        if loop is None:
+            raise RuntimeError("EventBus has no event loop yet; emit() once from the loop first")
+        
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                asyncio.create_task(self.emit(event_type, data))
-            else:
-                loop.run_until_complete(self.emit(event_type, data))
+            on_loop = asyncio.get_running_loop() is loop
         except RuntimeError:
-            # No event loop, create one
-            asyncio.run(self.emit(event_type, data))
+            on_loop = False
+        
+        if not on_loop:
+            # Worker thread: hand the coroutine to the owning loop
+            asyncio.run_coroutine_threadsafe(self.emit(event_type, data), loop)
+            return
+        
+        task = loop.create_task(self.emit(event_type, data))
+        self._pending_emits.add(task)
+        task.add_done_callback(self._pending_emits.discard)
     
     def get_history(self, event_type: Optional[EventType] = None, limit: int = 10) -> List[Event]:
         """
@@ -158,20 +269,33 @@ class EventBus:
         Returns:
             List of recent events
         """
-        history = list(self._history)
+        size = self._history_size
+        end = self._history_idx
+        start = max(0, end - size)
         
-        if event_type:
-            history = [e for e in history if e.event_type == event_type]
+        if event_type is None:
+            start = max(start, end - limit)
+            return [self._history[i % size] for i in range(start, end)]
         
-        return history[-limit:]
+        # Walk back from the newest event until enough matches are found
+        matches = []
+        for i in range(end - 1, start - 1, -1):
+            if len(matches) >= limit:
+                break
+            event = self._history[i % size]
+            if event.event_type == event_type:
+                matches.append(event)
+        matches.reverse()
+        return matches
     
     def clear_history(self) -> None:
         """Clear event history."""
-        self._history.clear()
+        self._history = [None] * self._history_size
+        self._history_idx = 0
     
     def get_subscriber_count(self, event_type: EventType) -> int:
         """Get number of subscribers for an event type."""
-        return len(self._subscribers[event_type])
+        return len(self._subscribers.get(event_type, ()))
     
     def get_all_subscribers(self) -> Dict[EventType, int]:
         """Get subscriber counts for all event types."""
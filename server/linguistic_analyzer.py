@@ -1,11 +1,75 @@
 """Linguistic analysis for text completeness."""
 import re
-from typing import Dict
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 from .config import config
 
 
+# Question words
+QUESTION_WORDS = frozenset({
+    "what", "when", "where", "who", "whom", "whose", "why", "which", "how",
+    "is", "are", "was", "were", "do", "does", "did", "can", "could",
+    "will", "would", "should", "shall", "may", "might", "must"
+})
+
+# Common verb forms (very simplified)
+COMMON_VERBS = frozenset({
+    'is', 'are', 'was', 'were', 'am', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did',
+    'can', 'could', 'will', 'would', 'should', 'shall',
+    'may', 'might', 'must',
+    'go', 'goes', 'went', 'going',
+    'get', 'gets', 'got', 'getting',
+    'make', 'makes', 'made', 'making',
+    'know', 'knows', 'knew', 'knowing',
+    'think', 'thinks', 'thought', 'thinking',
+    'see', 'sees', 'saw', 'seeing',
+    'want', 'wants', 'wanted', 'wanting',
+    'need', 'needs', 'needed', 'needing'
+})
+
+
+# Whitespace after sentence-ending punctuation (keeps "3.5" in one piece);
+# splitting on it leaves the unfinished tail as the last piece
+SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+
+def count_sentence_marks(text: str) -> int:
+    """
+    Count sentence-ending punctuation ('.', '?', '!') in text.
+    
+    Three str.count calls are each a C-level memchr-style scan and beat a
+    single regex/translate pass on transcript-sized strings.
+    
+    Args:
+        text: Text to scan
+    
+    Returns:
+        Number of sentence-ending marks
+    """
+    return text.count('.') + text.count('?') + text.count('!')
+
+
+def _content_end(text: str) -> int:
+    """
+    Index just past the last non-whitespace character of text.
+    
+    Scans back over trailing whitespace only, so checks on the end of a
+    long transcript don't pay for a stripped copy of the whole string.
+    
+    Args:
+        text: Text to scan
+    
+    Returns:
+        End index of the content (0 if text is empty or all whitespace)
+    """
+    end = len(text)
+    while end > 0 and text[end - 1].isspace():
+        end -= 1
+    return end
+
+
 @dataclass
 class LinguisticAnalysis:
     """Result of linguistic analysis."""
@@ -13,7 +77,7 @@ class LinguisticAnalysis:
     is_question: bool
     is_complete: bool
     word_count: int
-    sentence_count: int
+    sentence_count: int  # only counted when it affects the score (else 0)
     ends_with_continuation: bool
     ends_with_punctuation: bool
 
@@ -32,14 +96,8 @@ class LinguisticAnalyzer:
     
     def __init__(self):
         """Initialize linguistic analyzer."""
-        self.continuation_words = set(word.lower() for word in config.continuation_words)
-        
-        # Question words
-        self.question_words = {
-            "what", "when", "where", "who", "whom", "whose", "why", "which", "how",
-            "is", "are", "was", "were", "do", "does", "did", "can", "could",
-            "will", "would", "should", "shall", "may", "might", "must"
-        }
+        self.continuation_words = frozenset(word.lower() for word in config.continuation_words)
+        self.question_words = QUESTION_WORDS
     
     def analyze_completeness(self, text: str) -> LinguisticAnalysis:
         """
@@ -62,17 +120,16 @@ class LinguisticAnalyzer:
                 ends_with_punctuation=False
             )
         
+        # Strip, lowercase and split once; helpers reuse the word list
         text = text.strip()
-        
-        # Basic metrics
-        words = text.split()
+        words = text.lower().split()
         word_count = len(words)
         
         # Check for very short utterances
         if word_count < 3:
             return LinguisticAnalysis(
                 completeness_score=20,
-                is_question=self.is_question(text),
+                is_question=self.is_question(text, words),
                 is_complete=False,
                 word_count=word_count,
                 sentence_count=0,
@@ -80,22 +137,43 @@ class LinguisticAnalyzer:
                 ends_with_punctuation=self.ends_with_punctuation(text)
             )
         
-        # Analyze features
         ends_with_punct = self.ends_with_punctuation(text)
-        ends_with_cont = self.last_word_is_continuation(text)
-        is_quest = self.is_question(text)
-        sent_count = self.count_sentences(text)
-        has_subj_verb = self.has_subject_and_verb(text)
+        is_quest = self.is_question(text, words)
         
-        # Calculate completeness score
-        score = self._calculate_score(
-            word_count=word_count,
-            ends_with_punctuation=ends_with_punct,
-            ends_with_continuation=ends_with_cont,
-            is_question=is_quest,
-            sentence_count=sent_count,
-            has_subject_verb=has_subj_verb
-        )
+        # Penalty for ending with continuation word (decides the score alone)
+        if self.last_word_is_continuation(text, words):
+            return LinguisticAnalysis(
+                completeness_score=30,
+                is_question=is_quest,
+                is_complete=False,
+                word_count=word_count,
+                sentence_count=0,
+                ends_with_continuation=True,
+                ends_with_punctuation=ends_with_punct
+            )
+        
+        score = 0
+        sent_count = 0
+        
+        # Bonus for having subject and verb
+        if self.has_subject_and_verb(text, words):
+            score += 20
+        
+        # Punctuation-dependent bonuses (sentences only counted here)
+        if ends_with_punct:
+            # Bonus for ending with punctuation
+            score += 40
+            
+            # Bonus for complete sentence structure
+            sent_count = self.count_sentences(text)
+            if sent_count >= 1:
+                score += 30
+            
+            # Bonus for questions (usually complete)
+            if is_quest:
+                score += 10
+        
+        score = min(score, 100)
         
         return LinguisticAnalysis(
             completeness_score=score,
@@ -103,74 +181,44 @@ class LinguisticAnalyzer:
             is_complete=score >= 70,
             word_count=word_count,
             sentence_count=sent_count,
-            ends_with_continuation=ends_with_cont,
+            ends_with_continuation=False,
             ends_with_punctuation=ends_with_punct
         )
     
-    def _calculate_score(
-        self,
-        word_count: int,
-        ends_with_punctuation: bool,
-        ends_with_continuation: bool,
-        is_question: bool,
-        sentence_count: int,
-        has_subject_verb: bool
-    ) -> int:
-        """
-        Calculate completeness score.
-        
-        Returns:
-            Score from 0-100
-        """
-        score = 0
-        
-        # Penalty for ending with continuation word
-        if ends_with_continuation:
-            return 30
-        
-        # Bonus for ending with punctuation
-        if ends_with_punctuation:
-            score += 40
-        
-        # Bonus for having subject and verb
-        if has_subject_verb:
-            score += 20
-        
-        # Bonus for complete sentence structure
-        if sentence_count >= 1 and ends_with_punctuation:
-            score += 30
-        
-        # Bonus for questions (usually complete)
-        if is_question and ends_with_punctuation:
-            score += 10
-        
-        return min(score, 100)
-    
     def ends_with_punctuation(self, text: str) -> bool:
         """Check if text ends with sentence-ending punctuation."""
-        text = text.strip()
-        return len(text) > 0 and text[-1] in '.?!'
+        end = _content_end(text)
+        return end > 0 and text[end - 1] in '.?!'
     
-    def last_word_is_continuation(self, text: str) -> bool:
+    def last_word_is_continuation(self, text: str, words: Optional[List[str]] = None) -> bool:
         """Check if last word is a continuation word."""
-        words = text.strip().lower().split()
-        if not words:
-            return False
+        if words is not None:
+            if not words:
+                return False
+            last_word = words[-1]
+        else:
+            # Scan back over the last word only (no copy of the whole text)
+            end = _content_end(text)
+            start = end
+            while start > 0 and not text[start - 1].isspace():
+                start -= 1
+            if start == end:
+                return False
+            last_word = text[start:end].lower()
         
-        last_word = words[-1].rstrip('.,!?;:')
-        return last_word in self.continuation_words
+        return last_word.rstrip('.,!?;:') in self.continuation_words
     
-    def is_question(self, text: str) -> bool:
+    def is_question(self, text: str, words: Optional[List[str]] = None) -> bool:
         """Detect if text is a question."""
-        text = text.strip()
-        
         # Ends with question mark
-        if text.endswith('?'):
+        end = _content_end(text)
+        if end > 0 and text[end - 1] == '?':
             return True
         
         # Starts with question word
-        words = text.lower().split()
-        if words and words[0] in self.question_words:
+        if words is None:
+            words = text.lower().split()
+        if words and words[0] in QUESTION_WORDS:
             return True
         
         return False
@@ -178,7 +226,7 @@ class LinguisticAnalyzer:
     def count_sentences(self, text: str) -> int:
         """Count sentences in text."""
         # Simple sentence counting by punctuation
-        count = text.count('.') + text.count('?') + text.count('!')
+        count = count_sentence_marks(text)
         
         # If no punctuation but has words, count as 1 sentence
         if count == 0 and text.strip():
@@ -186,43 +234,24 @@ class LinguisticAnalyzer:
         
         return count
     
-    def has_subject_and_verb(self, text: str) -> bool:
+    def has_subject_and_verb(self, text: str, words: Optional[List[str]] = None) -> bool:
         """
         Simple heuristic for subject-verb detection.
         
         This is a basic implementation. A more sophisticated version
         would use NLP libraries like spaCy.
         """
-        words = text.lower().split()
+        if words is None:
+            words = text.lower().split()
         
         # Very basic: check if we have at least 2 words and some common verbs
         if len(words) < 2:
             return False
         
-        # Common verb forms (very simplified)
-        common_verbs = {
-            'is', 'are', 'was', 'were', 'am', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did',
-            'can', 'could', 'will', 'would', 'should', 'shall',
-            'may', 'might', 'must',
-            'go', 'goes', 'went', 'going',
-            'get', 'gets', 'got', 'getting',
-            'make', 'makes', 'made', 'making',
-            'know', 'knows', 'knew', 'knowing',
-            'think', 'thinks', 'thought', 'thinking',
-            'see', 'sees', 'saw', 'seeing',
-            'want', 'wants', 'wanted', 'wanting',
-            'need', 'needs', 'needed', 'needing'
-        }
-        
-        # Check if any word is a verb
-        for word in words:
-            clean_word = word.rstrip('.,!?;:')
-            if clean_word in common_verbs:
-                return True
-        
-        # If we have 3+ words, assume it has subject-verb
+        # If we have 3+ words, assume it has subject-verb (decided before
+        # the verb scan, which could only ever return True as well)
         if len(words) >= 3:
             return True
         
-        return False
+        # Two words: check if either is a verb
+        return not COMMON_VERBS.isdisjoint(word.rstrip('.,!?;:') for word in words)
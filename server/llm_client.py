@@ -1,11 +1,13 @@
 """OpenAI LLM client for chat completions."""
 import asyncio
-from typing import List, Optional, AsyncGenerator
-
-from openai import AsyncOpenAI
+import logging
+from typing import List, Optional, AsyncGenerator, Sequence, Tuple
 
 from .config import config
 from .event_bus import event_bus, EventType
+from .openai_client import get_openai_client
+
+logger = logging.getLogger(__name__)
 
 
 class LLMClient:
@@ -21,16 +23,17 @@ class LLMClient:
     
     def __init__(self):
         """Initialize LLM client."""
-        if config.openai_api_key:
-            self.client = AsyncOpenAI(api_key=config.openai_api_key)
-        else:
-            print("WARNING: OpenAI API key not set, LLM will not work")
-            self.client = None
+        self.client = get_openai_client()
+        if not self.client:
+            logger.warning("OpenAI API key not set, LLM will not work")
         
         self.model = config.llm_model
         self.max_tokens = config.llm_max_tokens
         self.temperature = config.llm_temperature
         
+        # History sent with each request (5 exchanges)
+        self.max_history_turns = 10
+        
         # System prompt
         self.system_prompt = (
             "You are a helpful voice assistant. Keep responses concise and natural, "
@@ -40,14 +43,14 @@ class LLMClient:
     
     async def generate_response(
         self,
-        conversation_history: str,
+        conversation_history: Sequence[Tuple[str, str]],
         user_utterance: str
     ) -> AsyncGenerator[str, None]:
         """
         Generate response using OpenAI.
         
         Args:
-            conversation_history: Recent conversation history
+            conversation_history: Recent (role, text) turns, oldest first
             user_utterance: Latest user utterance
         
         Yields:
@@ -75,72 +78,77 @@ class LLMClient:
                 stream=True
             )
             
-            # Stream chunks
+            # Stream chunks; RESPONSE_CHUNK events are batched (every 5
+            # chunks or 50ms) instead of one event per token
+            loop = asyncio.get_running_loop()
+            chunk_batch: List[str] = []
+            last_flush = loop.time()
+            
             async for chunk in response:
                 if chunk.choices[0].delta.content:
                     text = chunk.choices[0].delta.content
                     yield text
                     
-                    # Emit chunk event
-                    await event_bus.emit(EventType.RESPONSE_CHUNK, {
-                        "chunk": text
-                    })
+                    chunk_batch.append(text)
+                    if len(chunk_batch) >= 5 or loop.time() - last_flush > 0.05:
+                        await self._emit_chunk_batch(chunk_batch)
+                        chunk_batch = []
+                        last_flush = loop.time()
+            
+            # Flush the final partial batch
+            if chunk_batch:
+                await self._emit_chunk_batch(chunk_batch)
         
         except Exception as e:
-            print(f"LLM generation error: {e}")
+            logger.error("LLM generation error: %s", e)
             yield "I'm sorry, I encountered an error generating a response."
     
-    def build_messages(self, conversation_history: str, user_utterance: str) -> List[dict]:
+    async def _emit_chunk_batch(self, chunks: List[str]) -> None:
+        """
+        Emit one RESPONSE_CHUNK event for a batch of chunks.
+        
+        Args:
+            chunks: Response chunks in order
+        """
+        await event_bus.emit(EventType.RESPONSE_CHUNK, {
+            "chunks": chunks,
+            "text": "".join(chunks)
+        })
+    
+    def build_messages(
+        self,
+        conversation_history: Sequence[Tuple[str, str]],
+        user_utterance: str
+    ) -> List[dict]:
         """
         Build messages array from conversation history.
         
         Args:
-            conversation_history: Recent conversation
+            conversation_history: Recent (role, text) turns, oldest first
             user_utterance: Latest user input
         
         Returns:
             Messages array for OpenAI API
         """
-        messages = [
-            {"role": "system", "content": self.system_prompt}
-        ]
-        
-        # Parse conversation history
-        if conversation_history:
-            history_lines = conversation_history.strip().split('\n')
-            # Get last 10 lines (5 exchanges)
-            recent_history = history_lines[-10:]
-            
-            for line in recent_history:
-                if line.startswith("User:"):
-                    messages.append({
-                        "role": "user",
-                        "content": line.replace("User:", "").strip()
-                    })
-                elif line.startswith("Agent:"):
-                    messages.append({
-                        "role": "assistant",
-                        "content": line.replace("Agent:", "").strip()
-                    })
-        
-        # Add current user utterance
-        messages.append({
-            "role": "user",
-            "content": user_utterance
-        })
-        
-        return messages
+        # System prompt, last turns (already structured, no re-parsing),
+        # then the current user utterance
+        recent_history = conversation_history[-self.max_history_turns:]
+        return (
+            [{"role": "system", "content": self.system_prompt}]
+            + [{"role": role, "content": text} for role, text in recent_history]
+            + [{"role": "user", "content": user_utterance}]
+        )
     
     async def generate_response_complete(
         self,
-        conversation_history: str,
+        conversation_history: Sequence[Tuple[str, str]],
         user_utterance: str
     ) -> str:
         """
         Generate complete response (non-streaming).
         
         Args:
-            conversation_history: Recent conversation history
+            conversation_history: Recent (role, text) turns, oldest first
             user_utterance: Latest user utterance
         
         Returns:
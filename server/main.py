@@ -4,7 +4,11 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
+import logging
+import logging.handlers
+import queue
 from pathlib import Path
+from typing import Optional
 
 from .config import config
 from .event_bus import event_bus
@@ -25,6 +29,7 @@ from .tts_client import TTSClient
 from .response_coordinator import ResponseCoordinator
 from .audio_mixer import AudioMixer
 from .webrtc_handler import WebRTCHandler
+from .openai_client import close_openai_client
 
 
 # Create FastAPI app
@@ -42,6 +47,40 @@ app.add_middleware(
 # Global components
 components = {}
 
+# Queue handler on the root logger, drained to stderr by a background thread
+_log_handler: Optional[logging.handlers.QueueHandler] = None
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def start_log_listener() -> None:
+    """Route log records through a queue so logging never blocks the event loop."""
+    global _log_handler, _log_listener
+    
+    if _log_listener is not None:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    _log_handler = logging.handlers.QueueHandler(log_queue)
+    logging.getLogger().addHandler(_log_handler)
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+
+def stop_log_listener() -> None:
+    """Detach the queue handler and flush pending log records."""
+    global _log_handler, _log_listener
+    
+    if _log_listener is None:
+        return
+    
+    logging.getLogger().removeHandler(_log_handler)
+    _log_listener.stop()
+    _log_handler = None
+    _log_listener = None
+
 
 @app.on_event("startup")
 async def startup():
@@ -50,6 +89,15 @@ async def startup():
     print("Voice Conversation Agent - Starting Up")
     print("=" * 60)
     
+    # Formatting and stderr writes happen off the loop thread
+    start_log_listener()
+    
+    # Eager tasks run synchronously until their first real suspension, so
+    # event-bus callbacks and short-lived tasks that finish without
+    # awaiting skip a trip through the scheduler (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # Validate configuration
     try:
         config.validate_all()
@@ -129,10 +177,19 @@ async def shutdown():
     if 'audio_mixer' in components:
         await components['audio_mixer'].stop()
     
+    if 'vad_processor' in components:
+        components['vad_processor'].close()
+    
     if 'webrtc_handler' in components:
         await components['webrtc_handler'].close_all()
     
+    # Close pooled API connections
+    await close_openai_client()
+    
     print("✅ Shutdown complete")
+    
+    # Flush queued log records
+    stop_log_listener()
 
 
 async def vad_processing_loop():
@@ -143,14 +200,17 @@ async def vad_processing_loop():
     chunk_count = 0
     while True:
         try:
-            # Process VAD chunks
+            # Sleep until the pipeline has a full chunk (no 10ms polling)
+            await pipeline.vad_ready.wait()
+            pipeline.vad_ready.clear()
+            
+            # Drain every available chunk; VAD is a state machine, so
+            # chunks are processed strictly in order
             for chunk in pipeline.get_vad_chunks():
                 chunk_count += 1
                 if chunk_count % 100 == 0:
                     print(f"🔍 Processed {chunk_count} VAD chunks")
                 await vad.process_chunk(chunk)
-            
-            await asyncio.sleep(0.01)  # 10ms
         except Exception as e:
             print(f"VAD processing error: {e}")
             await asyncio.sleep(0.1)
@@ -225,9 +285,20 @@ if static_dir.exists():
 
 if __name__ == "__main__":
     import uvicorn
+    
+    # uvloop's libuv-based loop cuts scheduling overhead on the audio path;
+    # it isn't available on Windows, where the stdlib loop is used instead
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        print("⚠️  uvloop not installed, using the asyncio event loop")
+        loop = "asyncio"
+    
     uvicorn.run(
         "server.main:app",
         host=config.host,
         port=config.port,
+        loop=loop,
         reload=False
     )
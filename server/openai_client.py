@@ -0,0 +1,49 @@
+"""Shared OpenAI API client with a pooled HTTP connection."""
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from .config import config
+
+
+# Keep-alive pool shared by STT, TTS and LLM requests
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+_http_client: Optional[httpx.AsyncClient] = None
+_openai_client: Optional[AsyncOpenAI] = None
+
+
+def get_openai_client() -> Optional[AsyncOpenAI]:
+    """
+    Get the process-wide OpenAI client, creating it on first use.
+    
+    All API clients share one httpx connection pool, so requests reuse
+    open TCP/TLS connections instead of handshaking per call.
+    
+    Returns:
+        AsyncOpenAI instance, or None if no API key is configured
+    """
+    global _http_client, _openai_client
+    
+    if not config.openai_api_key:
+        return None
+    
+    if _openai_client is None:
+        _http_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+        _openai_client = AsyncOpenAI(api_key=config.openai_api_key, http_client=_http_client)
+    
+    return _openai_client
+
+
+async def close_openai_client() -> None:
+    """Close the shared client and its connection pool (call on shutdown)."""
+    global _http_client, _openai_client
+    
+    if _openai_client is not None:
+        await _openai_client.close()
+    if _http_client is not None:
+        await _http_client.aclose()
+    
+    _http_client = None
+    _openai_client = None
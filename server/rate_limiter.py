@@ -0,0 +1,108 @@
+"""Token-bucket rate limiter driven by API rate-limit headers."""
+import asyncio
+import re
+import time
+from typing import Mapping, Optional
+
+
+# Durations as sent in x-ratelimit-reset-* headers, e.g. "1s", "6m0s", "20ms"
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: str) -> Optional[float]:
+    """
+    Parse a rate-limit reset duration into seconds.
+    
+    Args:
+        value: Header value such as "1s", "6m0s" or "20ms"
+    
+    Returns:
+        Duration in seconds, or None if the value can't be parsed
+    """
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class RateLimiter:
+    """
+    Proactive token bucket for API requests.
+    
+    Features:
+    - Waits for a token before each request instead of backing off after a 429
+    - Bucket size and refill rate follow the server's x-ratelimit-* headers
+    - Unlimited until the first headers are seen
+    - FIFO fairness between waiters
+    """
+    
+    def __init__(self, resource: str = "requests"):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            resource: Rate-limit header suffix to track ("requests" or "tokens")
+        """
+        self.resource = resource
+        self.limit: Optional[float] = None
+        self.tokens = float("inf")
+        self.refill_per_s = 0.0
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill."""
+        now = time.monotonic()
+        if self.limit is not None:
+            self.tokens = min(self.limit, self.tokens + (now - self._last_refill) * self.refill_per_s)
+        self._last_refill = now
+    
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Wait until tokens are available, then take them.
+        
+        Args:
+            tokens: Number of tokens the request costs
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                
+                if self.refill_per_s <= 0:
+                    # Nothing known about refills yet; let the request through
+                    return
+                
+                await asyncio.sleep((tokens - self.tokens) / self.refill_per_s)
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Resize the bucket from the rate-limit headers of a response.
+        
+        Args:
+            headers: Response headers (x-ratelimit-limit-*, -remaining-*, -reset-*)
+        """
+        limit = headers.get(f"x-ratelimit-limit-{self.resource}")
+        remaining = headers.get(f"x-ratelimit-remaining-{self.resource}")
+        reset = headers.get(f"x-ratelimit-reset-{self.resource}")
+        if limit is None or remaining is None:
+            return
+        
+        try:
+            limit_value = float(limit)
+            remaining_value = float(remaining)
+        except ValueError:
+            return
+        
+        reset_s = parse_reset_duration(reset) if reset else None
+        
+        self._refill()
+        self.limit = limit_value
+        self.tokens = min(limit_value, remaining_value)
+        
+        # The used part of the window comes back by the reset time
+        if reset_s:
+            self.refill_per_s = max(limit_value - remaining_value, 1.0) / reset_s
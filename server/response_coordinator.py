@@ -1,12 +1,16 @@
 """Response coordination for LLM -> TTS flow."""
 import asyncio
-from typing import Optional
+import logging
+from typing import List, Optional, Tuple
 
 from .config import config
 from .event_bus import event_bus, EventType, Event
 from .conversation_manager import ConversationManager, ConversationState
 from .llm_client import LLMClient
 from .tts_client import TTSClient
+from .linguistic_analyzer import SENTENCE_BREAK
+
+logger = logging.getLogger(__name__)
 
 
 class ResponseCoordinator:
@@ -16,9 +20,10 @@ class ResponseCoordinator:
     Flow:
     1. Turn ends -> AGENT_THINKING
     2. Generate LLM response
-    3. Synthesize to speech -> AGENT_SPEAKING
-    4. Send audio to mixer
-    5. Complete -> IDLE
+    3. Synthesize each sentence as soon as the LLM completes it
+       -> AGENT_SPEAKING on first audio
+    4. Send audio chunks to mixer as they arrive
+    5. Mixer drains -> IDLE
     """
     
     def __init__(
@@ -56,7 +61,7 @@ class ResponseCoordinator:
         user_utterance = event.data.get("transcript", "")
         
         if not user_utterance:
-            print("WARNING: Turn ended with empty transcript")
+            logger.warning("Turn ended with empty transcript")
             return
         
         # Generate and play response
@@ -72,26 +77,43 @@ class ResponseCoordinator:
         # Update state to AGENT_THINKING
         await self.conversation_manager.update_state(ConversationState.AGENT_THINKING)
         
-        # Get conversation history
-        conversation_history = self.conversation_manager.get_full_conversation()
+        # Get conversation history (structured, only what the LLM will use)
+        conversation_history = self.conversation_manager.get_recent_turns(
+            self.llm_client.max_history_turns
+        )
         
         # Generate LLM response
         await event_bus.emit(EventType.RESPONSE_GENERATING, {
             "user_utterance": user_utterance
         })
         
-        # Collect response chunks
-        response_chunks = []
-        async for chunk in self.llm_client.generate_response(
-            conversation_history,
-            user_utterance
-        ):
-            response_chunks.append(chunk)
+        # LLM -> sentences -> TTS -> mixer, pipelined through a bounded queue
+        # so speech starts after the first sentence, not the whole reply
+        sentence_queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+        response_chunks: List[str] = []
+        
+        producer = asyncio.create_task(self._produce_sentences(
+            conversation_history, user_utterance, response_chunks, sentence_queue
+        ))
+        try:
+            total_samples = await self._speak_sentences(sentence_queue)
+        except BaseException:
+            # Consumer failed or we were cancelled: stop the producer, or it
+            # blocks forever on the full queue and leaks the LLM stream
+            producer.cancel()
+            try:
+                await producer
+            except BaseException:
+                pass
+            raise
+        
+        # Producer errors (after the consumer drained the queue) surface here
+        await producer
         
         response_text = "".join(response_chunks)
         
         if not response_text:
-            print("WARNING: Empty response from LLM")
+            logger.warning("Empty response from LLM")
             await self.conversation_manager.update_state(ConversationState.IDLE)
             return
         
@@ -102,36 +124,92 @@ class ResponseCoordinator:
             speaker="agent"
         )
         
-        # Synthesize to speech
-        audio = await self.tts_client.synthesize(response_text)
-        
-        if audio is None:
-            print("WARNING: TTS synthesis failed")
+        if total_samples == 0:
+            logger.warning("TTS synthesis failed")
             await self.conversation_manager.update_state(ConversationState.IDLE)
             return
         
-        # Update state to AGENT_SPEAKING
-        await self.conversation_manager.update_state(ConversationState.AGENT_SPEAKING)
-        
-        # Emit response started
-        await event_bus.emit(EventType.RESPONSE_STARTED, {
-            "text": response_text,
-            "audio_duration_s": len(audio) / config.sample_rate
-        })
-        
-        # Send to mixer on primary channel
-        await self.audio_mixer.add_primary_audio(audio)
-        
-        # Wait for playback to complete
-        # (In a real system, you'd track playback progress)
-        playback_duration = len(audio) / config.sample_rate
-        await asyncio.sleep(playback_duration)
+        # Wait for playback to complete; the duration bound covers the case
+        # where nobody is pulling audio from the mixer
+        audio_duration_s = total_samples / config.sample_rate
+        await self.audio_mixer.wait_primary_drained(timeout=audio_duration_s + 1.0)
         
         # Emit response ended
         await event_bus.emit(EventType.RESPONSE_ENDED, {
-            "text": response_text
+            "text": response_text,
+            "audio_duration_s": audio_duration_s
         })
         
         # Reset turn and return to IDLE
         await self.conversation_manager.reset_turn()
         await self.conversation_manager.update_state(ConversationState.IDLE)
+    
+    async def _produce_sentences(
+        self,
+        conversation_history: List[Tuple[str, str]],
+        user_utterance: str,
+        response_chunks: List[str],
+        sentence_queue: asyncio.Queue
+    ) -> None:
+        """
+        Stream the LLM reply and queue it sentence by sentence.
+        
+        Args:
+            conversation_history: Formatted conversation so far
+            user_utterance: User's utterance
+            response_chunks: Receives every raw LLM chunk (full reply text)
+            sentence_queue: Queue of sentences; None marks the end
+        """
+        pending = ""
+        try:
+            async for chunk in self.llm_client.generate_response(
+                conversation_history,
+                user_utterance
+            ):
+                response_chunks.append(chunk)
+                
+                # Everything before the last sentence break is complete
+                *sentences, pending = SENTENCE_BREAK.split(pending + chunk)
+                for sentence in sentences:
+                    if sentence.strip():
+                        await sentence_queue.put(sentence)
+            
+            if pending.strip():
+                await sentence_queue.put(pending)
+        except asyncio.CancelledError:
+            # The consumer is gone; nobody will read an end marker
+            raise
+        except Exception:
+            # Let the consumer finish what is queued, then surface the error
+            await sentence_queue.put(None)
+            raise
+        
+        await sentence_queue.put(None)
+    
+    async def _speak_sentences(self, sentence_queue: asyncio.Queue) -> int:
+        """
+        Synthesize queued sentences and send them to the mixer.
+        
+        Args:
+            sentence_queue: Queue of sentences; None marks the end
+        
+        Returns:
+            Total number of samples sent to the mixer
+        """
+        total_samples = 0
+        while (sentence := await sentence_queue.get()) is not None:
+            async for audio in self.tts_client.synthesize_stream(sentence):
+                if total_samples == 0:
+                    # First audio: we are speaking now, not after the full reply
+                    await self.conversation_manager.update_state(ConversationState.AGENT_SPEAKING)
+                    
+                    # Emit response started
+                    await event_bus.emit(EventType.RESPONSE_STARTED, {
+                        "text": sentence
+                    })
+                
+                # Send to mixer on primary channel
+                self.audio_mixer.add_primary_audio(audio)
+                total_samples += len(audio)
+        
+        return total_samples
@@ -1,14 +1,20 @@
 """OpenAI Whisper API client for speech-to-text."""
 import asyncio
+import random
+import struct
 from typing import Optional
 import numpy as np
 import io
-import wave
-
-from openai import AsyncOpenAI
 
 from .config import config
 from .event_bus import event_bus, EventType
+from .openai_client import get_openai_client
+from .rate_limiter import RateLimiter
+from .audio_utils import float_to_int16
+
+
+# 44-byte RIFF/WAVE header for PCM16 mono
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
 
 
 class STTClient:
@@ -25,11 +31,15 @@ class STTClient:
     
     def __init__(self):
         """Initialize STT client."""
-        self.client = AsyncOpenAI(api_key=config.openai_api_key) if config.openai_api_key else None
+        self.client = get_openai_client()
         self.sample_rate = config.sample_rate
+        self._inv_sample_rate = 1.0 / self.sample_rate
         self.max_retries = 3
         self.base_delay = 1.0  # seconds
         
+        # Request budget, sized from Whisper's x-ratelimit-* headers
+        self.limiter = RateLimiter("requests")
+        
         if not self.client:
             print("WARNING: OpenAI API key not set, STT will not work")
     
@@ -47,9 +57,16 @@ class STTClient:
         if not self.client:
             return None
         
+        # Normalize once (no-op for float32 arrays) so lists or other dtypes
+        # don't take slow paths below
+        audio_data = np.asarray(audio_data, dtype=np.float32)
+        
         # Convert audio to WAV format
         audio_bytes = self.convert_audio_format(audio_data)
         
+        # Wait for a request token instead of running into 429s
+        await self.limiter.acquire(1)
+        
         # Transcribe with retry
         text = await self.retry_with_backoff(
             lambda: self._transcribe_internal(audio_bytes)
@@ -61,7 +78,7 @@ class STTClient:
             await event_bus.emit(event_type, {
                 "text": text,
                 "is_final": is_final,
-                "audio_duration_s": len(audio_data) / self.sample_rate
+                "audio_duration_s": audio_data.shape[0] * self._inv_sample_rate
             })
         
         return text
@@ -73,12 +90,14 @@ class STTClient:
             audio_file = io.BytesIO(audio_bytes)
             audio_file.name = "audio.wav"
             
-            # Call Whisper API
-            transcript = await self.client.audio.transcriptions.create(
+            # Call Whisper API (raw response, for the rate-limit headers)
+            response = await self.client.audio.transcriptions.with_raw_response.create(
                 model="whisper-1",
                 file=audio_file,
                 response_format="text"
             )
+            self.limiter.update_from_headers(response.headers)
+            transcript = response.parse()
             
             return transcript.strip() if transcript else None
             
@@ -96,18 +115,19 @@ class STTClient:
         Returns:
             WAV file bytes
         """
-        # Convert to int16
-        audio_int16 = (audio * 32767).astype(np.int16)
-        
-        # Create WAV file in memory
-        buffer = io.BytesIO()
-        with wave.open(buffer, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(self.sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
-        
-        return buffer.getvalue()
+        # Convert to int16 (clipped, so loud samples don't wrap around)
+        pcm = float_to_int16(audio)
+        
+        # Header + samples; no wave writer or intermediate file object
+        n = pcm.nbytes
+        header = _WAV_HEADER.pack(
+            b'RIFF', 36 + n, b'WAVE',
+            b'fmt ', 16, 1, 1,  # PCM, mono
+            self.sample_rate, self.sample_rate * 2, 2, 16,  # byte rate, block align, bits
+            b'data', n
+        )
+        # Join copies the samples straight from the array buffer (no tobytes)
+        return b"".join((header, memoryview(pcm)))
     
     async def retry_with_backoff(self, func, max_retries: Optional[int] = None):
         """
@@ -128,13 +148,16 @@ class STTClient:
                 result = await func()
                 return result
             except Exception as e:
-                if attempt == max_retries - 1:
+                # Give up before sleeping: no wait after the final attempt
+                if attempt >= max_retries - 1:
                     print(f"Max retries reached: {e}")
                     return None
                 
-                # Exponential backoff
+                # Exponential backoff with jitter (50-100% of the delay) so
+                # chunks that failed together don't all retry together
                 delay = self.base_delay * (2 ** attempt)
-                print(f"Retry {attempt + 1}/{max_retries} after {delay}s: {e}")
+                delay *= 0.5 + random.random() * 0.5
+                print(f"Retry {attempt + 1}/{max_retries} after {delay:.2f}s: {e}")
                 await asyncio.sleep(delay)
         
         return None
@@ -1,14 +1,32 @@
 """Transcription coordinator for chunked STT."""
 import asyncio
-from typing import Dict, List, Optional
+import logging
+from difflib import SequenceMatcher
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
 import uuid
 from datetime import datetime
 
+import numpy as np
+
 from .config import config
 from .event_bus import event_bus, EventType
 from .stt_client import STTClient
 from .audio_pipeline import AudioPipeline
 
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds (seconds) of the chunk duration buckets: <2s, 2-5s, >5s
+_BUCKET_LIMITS_S = (2.0, 5.0)
+
+# Punctuation ignored when comparing words across transcripts
+_WORD_PUNCTUATION = '.,!?;:"\''
+
+# Shortest word run accepted as an overlap (single common words like
+# "the" would otherwise match by chance)
+_MIN_OVERLAP_WORDS = 2
+
 
 class TranscriptionCoordinator:
     """
@@ -16,8 +34,9 @@ class TranscriptionCoordinator:
     
     Features:
     - Collect 1.5s audio chunks with 0.5s overlap
-    - Send to STT client
-    - Deduplicate overlapping results
+    - Batch chunks over a short window, grouped by duration bucket
+    - Send to STT client with a bounded number of concurrent requests
+    - Deduplicate overlapping results (handled in chunk order)
     - Build continuous transcript
     """
     
@@ -34,18 +53,29 @@ class TranscriptionCoordinator:
         self.stt_client = stt_client
         self.conversation_manager = conversation_manager
         
+        # Request scheduling
+        self.batch_window_s = config.stt_batch_window_ms / 1000
+        self._request_slots = asyncio.Semaphore(config.stt_max_concurrent_requests)
+        
         # State
-        self.in_flight_requests: Dict[str, asyncio.Task] = {}
-        self.recent_transcripts: List[str] = []
-        self.full_transcript = ""
+        self.in_flight_requests: Dict[str, asyncio.Task] = {}  # keyed by batch id
+        self._last_batch: Optional[asyncio.Task] = None
+        # Recent (text, normalized words) pairs, tokenized once on arrival
+        self.recent_transcripts: List[Tuple[str, Tuple[str, ...]]] = []
+        self.full_transcript: List[str] = []  # deduplicated fragments
         
         self.running = False
         self.task: Optional[asyncio.Task] = None
     
+    @property
+    def full_transcript_text(self) -> str:
+        """Full transcript so far, joined on demand."""
+        return " ".join(self.full_transcript)
+    
     async def start(self) -> None:
         """Start transcription coordination loop."""
         self.running = True
-        self.task = asyncio.create_task(self._coordination_loop())
+        self.task = asyncio.create_task(self._bucket_and_flush())
         print("✓ Transcription coordinator started")
     
     async def stop(self) -> None:
@@ -59,46 +89,117 @@ class TranscriptionCoordinator:
                 pass
         print("✓ Transcription coordinator stopped")
     
-    async def _coordination_loop(self) -> None:
-        """Main coordination loop."""
+    async def _bucket_and_flush(self) -> None:
+        """
+        Main coordination loop.
+        
+        Waits on the pipeline's Whisper chunks (no polling), collects them
+        over the batch window and dispatches runs of same-bucket chunks
+        in arrival order.
+        """
+        loop = asyncio.get_running_loop()
+        
         while self.running:
             try:
-                # Get chunks from audio pipeline
-                for chunk in self.audio_pipeline.get_whisper_chunks():
-                    # Send for transcription
-                    chunk_id = str(uuid.uuid4())
-                    print(f"🎵 Sending {len(chunk)} samples to Whisper API...")
-                    task = asyncio.create_task(
-                        self._transcribe_and_handle(chunk, chunk_id)
-                    )
-                    self.in_flight_requests[chunk_id] = task
-                
-                # Clean up completed tasks
-                completed_ids = [
-                    cid for cid, task in self.in_flight_requests.items()
-                    if task.done()
-                ]
-                for cid in completed_ids:
-                    del self.in_flight_requests[cid]
+                # Block until the first chunk, then gather whatever else
+                # arrives within the batch window
+                chunks = [await self.audio_pipeline.next_whisper_chunk()]
+                deadline = loop.time() + self.batch_window_s
+                while (remaining := deadline - loop.time()) > 0:
+                    try:
+                        chunks.append(
+                            await asyncio.wait_for(
+                                self.audio_pipeline.next_whisper_chunk(), timeout=remaining
+                            )
+                        )
+                    except asyncio.TimeoutError:
+                        break
                 
-                # Wait a bit before next iteration
-                await asyncio.sleep(0.1)
+                # Split at bucket changes rather than regrouping, so batches
+                # (and their transcripts) stay in chunk order
+                for bucket_index, run in groupby(chunks, key=self._bucket_index):
+                    self._dispatch_batch(bucket_index, list(run))
                 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                print(f"Transcription coordination error: {e}")
+                logger.error("Transcription coordination error: %s", e)
+                # Back off so a persistent failure doesn't spin the loop
                 await asyncio.sleep(1.0)
     
-    async def _transcribe_and_handle(self, audio_chunk, chunk_id: str) -> None:
+    def _bucket_index(self, chunk: np.ndarray) -> int:
         """
-        Transcribe chunk and handle result.
+        Get the duration bucket of a chunk.
+        
+        Args:
+            chunk: Audio data
+        
+        Returns:
+            Index into the buckets (0: <2s, 1: 2-5s, 2: >5s)
+        """
+        duration_s = len(chunk) / config.sample_rate
+        for index, limit in enumerate(_BUCKET_LIMITS_S):
+            if duration_s < limit:
+                return index
+        return len(_BUCKET_LIMITS_S)
+    
+    def _dispatch_batch(self, bucket_index: int, chunks: List[np.ndarray]) -> None:
+        """
+        Start transcription of one bucket of chunks.
+        
+        Args:
+            bucket_index: Duration bucket of the chunks
+            chunks: Audio chunks, oldest first
+        """
+        batch_id = f"{bucket_index}-{uuid.uuid4().hex[:8]}"
+        task = asyncio.create_task(self._transcribe_batch(chunks, self._last_batch))
+        self._last_batch = task
+        self.in_flight_requests[batch_id] = task
+        task.add_done_callback(lambda _: self.in_flight_requests.pop(batch_id, None))
+    
+    async def _transcribe_batch(
+        self,
+        chunks: List[np.ndarray],
+        previous_batch: Optional[asyncio.Task]
+    ) -> None:
+        """
+        Transcribe a batch of chunks concurrently and handle results in order.
+        
+        Args:
+            chunks: Audio chunks, oldest first
+            previous_batch: Batch dispatched before this one
+        """
+        texts = await asyncio.gather(*(self._transcribe_limited(chunk) for chunk in chunks))
+        
+        # Deduplication compares against earlier text, so results are
+        # handled only after the previous batch has handled its own
+        if previous_batch is not None and not previous_batch.done():
+            await asyncio.wait((previous_batch,))
+        
+        for text in texts:
+            await self._handle_transcript(text)
+    
+    async def _transcribe_limited(self, audio_chunk: np.ndarray) -> Optional[str]:
+        """
+        Transcribe a chunk while holding one of the request slots.
         
         Args:
             audio_chunk: Audio data
-            chunk_id: Unique chunk identifier
+        
+        Returns:
+            Transcribed text or None on error
         """
-        # Transcribe
-        text = await self.stt_client.transcribe_chunk(audio_chunk, is_final=False)
+        async with self._request_slots:
+            print(f"🎵 Sending {len(audio_chunk)} samples to Whisper API...")
+            return await self.stt_client.transcribe_chunk(audio_chunk, is_final=False)
+    
+    async def _handle_transcript(self, text: Optional[str]) -> None:
+        """
+        Deduplicate a transcription result and record the new text.
         
+        Args:
+            text: Transcribed text (None on error)
+        """
         print(f"📝 Whisper result: '{text}'")
         
         if text:
@@ -116,7 +217,7 @@ class TranscriptionCoordinator:
                 )
                 
                 # Update full transcript
-                self.full_transcript += " " + new_text
+                self.full_transcript.append(new_text)
     
     def deduplicate(self, new_text: str) -> str:
         """
@@ -128,44 +229,47 @@ class TranscriptionCoordinator:
         Returns:
             Deduplicated text (only new words)
         """
+        new_words = new_text.split()
+        new_norm = tuple(word.lower().strip(_WORD_PUNCTUATION) for word in new_words)
+        if not new_norm:
+            return ""
+        
         if not self.recent_transcripts:
-            self.recent_transcripts.append(new_text)
+            self.recent_transcripts.append((new_text, new_norm))
             return new_text
         
-        # Compare with last 2 transcripts
-        new_words = new_text.lower().split()
+        # Longest run of words shared with the previous transcript (difflib
+        # matcher; case and punctuation differences are normalized away)
+        _, recent_norm = self.recent_transcripts[-1]
+        match = SequenceMatcher(None, recent_norm, new_norm, autojunk=False).find_longest_match(
+            0, len(recent_norm), 0, len(new_norm)
+        )
         
-        for recent in self.recent_transcripts[-2:]:
-            recent_words = recent.lower().split()
-            
-            # Calculate overlap
-            overlap_count = 0
-            for i in range(min(len(new_words), len(recent_words))):
-                if new_words[i] == recent_words[i]:
-                    overlap_count += 1
-                else:
-                    break
-            
-            # If >80% overlap, extract only new words
-            if overlap_count / len(new_words) > 0.8:
-                new_words = new_words[overlap_count:]
-                break
+        # Overlap if the run is long enough (or is the whole new text) and
+        # either continues from the previous tail or covers most of the text
+        long_enough = match.size >= _MIN_OVERLAP_WORDS or match.size == len(new_norm)
+        continues_tail = match.a + match.size >= len(recent_norm) - 1 and match.b <= 1
+        mostly_repeated = match.size / len(new_norm) > 0.8
+        
+        words = new_words
+        if long_enough and (continues_tail or mostly_repeated):
+            words = new_words[match.b + match.size:]
         
         # Update recent transcripts
-        self.recent_transcripts.append(new_text)
+        self.recent_transcripts.append((new_text, new_norm))
         if len(self.recent_transcripts) > 3:
             self.recent_transcripts.pop(0)
         
-        # Return deduplicated text
-        deduplicated = " ".join(new_words)
-        return deduplicated if deduplicated else ""
+        # Return deduplicated text (original casing kept)
+        return " ".join(words)
     
     def reset(self) -> None:
         """Reset transcription state."""
         self.recent_transcripts.clear()
-        self.full_transcript = ""
+        self.full_transcript.clear()
         
         # Cancel in-flight requests
-        for task in self.in_flight_requests.values():
+        for task in list(self.in_flight_requests.values()):
             task.cancel()
         self.in_flight_requests.clear()
+        self._last_batch = None
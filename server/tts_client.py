@@ -1,14 +1,20 @@
 """OpenAI TTS client."""
 import asyncio
-from typing import Optional
+from collections import OrderedDict
+from typing import AsyncGenerator, AsyncIterator, List, Optional, Tuple
 import numpy as np
 import io
 import wave
-
-from openai import AsyncOpenAI
+import soxr
 
 from .config import config
 from .event_bus import event_bus, EventType
+from .openai_client import get_openai_client
+from .linguistic_analyzer import SENTENCE_BREAK
+
+
+# OpenAI TTS "pcm" output is fixed at 24kHz 16-bit mono (no rate option)
+TTS_SAMPLE_RATE = 24000
 
 
 class TTSClient:
@@ -23,11 +29,16 @@ class TTSClient:
     
     def __init__(self):
         """Initialize TTS client."""
-        self.client = AsyncOpenAI(api_key=config.openai_api_key) if config.openai_api_key else None
+        self.client = get_openai_client()
         self.voice = config.tts_voice
         self.model = config.tts_model
         self.sample_rate = config.sample_rate
         
+        # LRU of synthesized audio keyed by (text, voice, model), so repeated
+        # phrases skip the API round trip
+        self.cache_size = config.tts_cache_size
+        self._cache: "OrderedDict[Tuple[str, str, str], np.ndarray]" = OrderedDict()
+        
         if not self.client:
             print("WARNING: OpenAI API key not set, TTS will not work")
     
@@ -47,72 +58,125 @@ class TTSClient:
         if not text or not text.strip():
             return None
         
+        # Collect the streamed, already resampled blocks; no need to hold
+        # the 24kHz payload or resample it in one pass
+        chunks = [audio async for audio in self.synthesize_stream(text)]
+        if not chunks:
+            return None
+        
+        return np.concatenate(chunks)
+    
+    async def synthesize_stream(
+        self,
+        text: str,
+        chunk_size: int = 4800
+    ) -> AsyncGenerator[np.ndarray, None]:
+        """
+        Synthesize text to speech, yielding audio as it arrives.
+        
+        Args:
+            text: Text to synthesize
+            chunk_size: Bytes per network read (4800 = 100ms at 24kHz)
+        
+        Yields:
+            Float32 audio chunks at the pipeline sample rate
+        """
+        if not self.client:
+            return
+        
+        if not text or not text.strip():
+            return
+        
+        # Cache hit: replay the stored audio as one block
+        key = (text, self.voice, self.model)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            yield cached
+            return
+        
+        blocks: List[np.ndarray] = []
+        
+        # OpenAI TTS PCM is 24kHz 16-bit; resample across chunk boundaries
+        resampler = soxr.ResampleStream(TTS_SAMPLE_RATE, self.sample_rate, 1, dtype='float32')
+        leftover = b""
+        
         try:
-            # Call TTS API
-            response = await self.client.audio.speech.create(
+            async with self.client.audio.speech.with_streaming_response.create(
                 model=self.model,
                 voice=self.voice,
                 input=text,
                 response_format="pcm"  # Raw PCM audio
-            )
-            
-            # Get audio bytes
-            audio_bytes = await response.aread()
-            
-            # Convert to numpy array
-            # OpenAI TTS returns 24kHz 16-bit PCM by default
-            audio = np.frombuffer(audio_bytes, dtype=np.int16)
-            
-            # Convert to float32 [-1, 1]
-            audio = audio.astype(np.float32) / 32768.0
-            
-            # Resample to 16kHz if needed
-            # OpenAI TTS actually returns 24kHz, so we need to downsample
-            audio = self._resample_24k_to_16k(audio)
+            ) as response:
+                async for data in response.iter_bytes(chunk_size):
+                    # Network reads can split a sample; carry the odd byte
+                    data = leftover + data
+                    usable = len(data) & ~1
+                    leftover = data[usable:]
+                    if not usable:
+                        continue
+                    
+                    pcm = np.frombuffer(data[:usable], dtype=np.int16)
+                    audio = resampler.resample_chunk(pcm.astype(np.float32) / 32768.0)
+                    if len(audio):
+                        blocks.append(audio)
+                        yield audio
             
-            return audio
+            # Flush the samples still held in the filter delay line
+            tail = resampler.resample_chunk(np.empty(0, dtype=np.float32), last=True)
+            if len(tail):
+                blocks.append(tail)
+                yield tail
         
         except Exception as e:
-            print(f"TTS synthesis error: {e}")
-            return None
+            print(f"TTS streaming error: {e}")
+            return
+        
+        # Only complete syntheses are cached
+        if blocks:
+            self._cache_audio(key, np.concatenate(blocks))
     
-    def _resample_24k_to_16k(self, audio: np.ndarray) -> np.ndarray:
+    def _cache_audio(self, key: Tuple[str, str, str], audio: np.ndarray) -> None:
         """
-        Resample from 24kHz to 16kHz.
+        Store synthesized audio, evicting the least recently used entry.
         
         Args:
-            audio: Audio at 24kHz
-        
-        Returns:
-            Audio at 16kHz
+            key: (text, voice, model)
+            audio: Complete synthesized audio (stored read-only, shared)
         """
-        from scipy import signal as scipy_signal
+        if self.cache_size <= 0:
+            return
         
-        # Resample from 24000 to 16000
-        num_samples = int(len(audio) * 16000 / 24000)
-        resampled = scipy_signal.resample(audio, num_samples)
-        
-        return resampled.astype(np.float32)
+        audio.setflags(write=False)
+        self._cache[key] = audio
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
     
-    async def synthesize_streaming(self, text_stream) -> np.ndarray:
+    async def synthesize_streaming(
+        self,
+        text_stream: AsyncIterator[str]
+    ) -> AsyncGenerator[np.ndarray, None]:
         """
-        Synthesize from streaming text.
+        Synthesize from streaming text, one sentence at a time.
         
-        For now, we accumulate all text and synthesize once.
-        True streaming TTS would require a different approach.
+        Each sentence is sent to TTS as soon as its end arrives, so audio
+        starts while the text stream is still producing.
         
         Args:
-            text_stream: Async generator of text chunks
+            text_stream: Async iterator of text chunks
         
-        Returns:
-            Complete audio
+        Yields:
+            Float32 audio chunks at the pipeline sample rate
         """
-        # Accumulate text
-        text_chunks = []
+        pending = ""
         async for chunk in text_stream:
-            text_chunks.append(chunk)
-        
-        full_text = "".join(text_chunks)
+            # Everything before the last sentence break is complete
+            *sentences, pending = SENTENCE_BREAK.split(pending + chunk)
+            for sentence in sentences:
+                async for audio in self.synthesize_stream(sentence):
+                    yield audio
         
-        # Synthesize
-        return await self.synthesize(full_text)
+        # Flush the unterminated tail
+        async for audio in self.synthesize_stream(pending):
+            yield audio
@@ -1,5 +1,6 @@
 """Turn detection using multi-signal analysis."""
 import asyncio
+from bisect import bisect_right
 from typing import Optional
 from dataclasses import dataclass
 
@@ -53,6 +54,17 @@ class TurnDetector:
         self.long_pause_ms = config.long_pause_ms
         self.turn_end_threshold = config.turn_end_score_threshold
         
+        # Silence score table: a pause scores _silence_scores[i] where i is
+        # the number of bounds it has reached
+        self._silence_bounds = (self.short_pause_ms, 700, self.medium_pause_ms, self.long_pause_ms)
+        self._silence_scores = (
+            10,   # too short (< 400ms)
+            20,   # short pause (400-700ms)
+            50,   # medium pause (700-1000ms)
+            80,   # long pause (1000-1500ms)
+            100,  # very long pause (> 1500ms)
+        )
+        
         # Subscribe to events
         event_bus.subscribe(EventType.SILENCE_DETECTED, self.on_silence_detected)
     
@@ -122,21 +134,7 @@ class TurnDetector:
         Returns:
             Score from 0-100
         """
-        if duration_ms < self.short_pause_ms:
-            # Too short (< 400ms)
-            return 10
-        elif duration_ms < 700:
-            # Short pause (400-700ms)
-            return 20
-        elif duration_ms < self.medium_pause_ms:
-            # Medium pause (700-1000ms)
-            return 50
-        elif duration_ms < self.long_pause_ms:
-            # Long pause (1000-1500ms)
-            return 80
-        else:
-            # Very long pause (> 1500ms)
-            return 100
+        return self._silence_scores[bisect_right(self._silence_bounds, duration_ms)]
     
     async def calculate_linguistic_score(self) -> int:
         """
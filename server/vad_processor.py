@@ -2,9 +2,10 @@
 import numpy as np
 import onnxruntime as ort
 from enum import Enum
-from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .config import config
 from .event_bus import event_bus, EventType
@@ -17,6 +18,184 @@ class VADState(Enum):
     SILENCE_AFTER_SPEECH = "silence_after_speech"
 
 
+class VADBatcher:
+    """
+    Shared Silero VAD model that batches inference across sessions.
+    
+    Features:
+    - One InferenceSession shared by all VADProcessors (loaded once)
+    - Chunks submitted together run as one [B, T] inference
+    - Inference runs on a dedicated thread, off the event loop
+    - Per-session recurrent state passed in and handed back
+    """
+    
+    _instance: Optional["VADBatcher"] = None
+    
+    @classmethod
+    def instance(cls) -> "VADBatcher":
+        """Get the process-wide batcher."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self, max_batch: int = 8):
+        """
+        Initialize VAD batcher.
+        
+        Args:
+            max_batch: Maximum chunks per inference
+        """
+        self.max_batch = max_batch
+        self.session: Optional[ort.InferenceSession] = None
+        self._sr = np.array([config.sample_rate], dtype=np.int64)
+        
+        # Inference runs off the event loop on one dedicated thread (ONNX
+        # Runtime parallelizes internally; one worker keeps calls ordered)
+        self._ort_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad")
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def load_model(self, model_path: str) -> ort.InferenceSession:
+        """
+        Load the VAD model (once; later calls reuse the session).
+        
+        Args:
+            model_path: Path to the Silero VAD ONNX model
+        
+        Returns:
+            Shared InferenceSession
+        """
+        if self.session is None:
+            # Full graph optimization; one thread per inference, since the
+            # model is tiny and runs on its own worker thread
+            sess_options = ort.SessionOptions()
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            sess_options.intra_op_num_threads = 1
+            sess_options.inter_op_num_threads = 1
+            
+            self.session = ort.InferenceSession(
+                model_path,
+                sess_options=sess_options,
+                providers=['CPUExecutionProvider']
+            )
+        return self.session
+    
+    async def submit(self, audio: np.ndarray, state: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Queue one chunk for inference and wait for its result.
+        
+        Args:
+            audio: Preprocessed audio, shape (1, samples)
+            state: Session's recurrent state, shape (2, 1, 128)
+        
+        Returns:
+            Tuple of (speech probability, new state)
+        """
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._batch_loop())
+        
+        future = loop.create_future()
+        self._queue.put_nowait((audio, state, future))
+        return await future
+    
+    async def _batch_loop(self) -> None:
+        """Collect queued chunks into batches and run them."""
+        loop = asyncio.get_running_loop()
+        items: List[tuple] = []
+        
+        try:
+            while True:
+                items = [await self._queue.get()]
+                
+                # Let chunks submitted in the same loop iteration join the batch;
+                # no timed wait, so a lone session pays no extra latency
+                await asyncio.sleep(0)
+                while len(items) < self.max_batch and not self._queue.empty():
+                    items.append(self._queue.get_nowait())
+                
+                # Chunks of different lengths can't be stacked together
+                groups: Dict[int, List[tuple]] = {}
+                for item in items:
+                    groups.setdefault(item[0].shape[1], []).append(item)
+                
+                for group in groups.values():
+                    try:
+                        probabilities, states = await loop.run_in_executor(
+                            self._ort_executor, self._run_batch,
+                            [audio for audio, _, _ in group],
+                            [state for _, state, _ in group]
+                        )
+                    except Exception as e:
+                        self._fail_pending(group, e)
+                        continue
+                    
+                    for i, (_, _, future) in enumerate(group):
+                        if not future.done():
+                            future.set_result((float(probabilities[i]), states[:, i:i + 1]))
+        finally:
+            # Stopped mid-batch (close): don't leave callers waiting forever
+            self._fail_pending(items, RuntimeError("VAD batcher closed"))
+    
+    @staticmethod
+    def _fail_pending(items: List[tuple], error: BaseException) -> None:
+        """
+        Resolve the futures of queued chunks that have no result yet.
+        
+        Args:
+            items: Queued (audio, state, future) tuples
+            error: Exception handed to each waiting caller
+        """
+        for _, _, future in items:
+            if not future.done():
+                future.set_exception(error)
+    
+    def _run_batch(
+        self,
+        audios: List[np.ndarray],
+        states: List[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run one batched inference (VAD thread).
+        
+        Args:
+            audios: Chunks of equal length, each shape (1, samples)
+            states: Matching recurrent states, each shape (2, 1, 128)
+        
+        Returns:
+            Tuple of (probabilities shape (B,), states shape (2, B, 128))
+        """
+        if len(audios) == 1:
+            batch_audio, batch_state = audios[0], states[0]
+        else:
+            batch_audio = np.concatenate(audios, axis=0)
+            batch_state = np.concatenate(states, axis=1)
+        
+        ort_outputs = self.session.run(None, {
+            'input': batch_audio,
+            'state': batch_state,
+            'sr': self._sr
+        })
+        return ort_outputs[0][:, 0], ort_outputs[1]
+    
+    def close(self) -> None:
+        """Stop the batch loop and the inference thread."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        
+        # Chunks still queued will never run; fail them so callers return
+        if self._queue is not None:
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._fail_pending(pending, RuntimeError("VAD batcher closed"))
+        
+        self._ort_executor.shutdown(wait=False, cancel_futures=True)
+
+
 class VADProcessor:
     """
     Voice Activity Detection using Silero VAD ONNX model.
@@ -26,6 +205,9 @@ class VADProcessor:
     - State machine with hysteresis
     - Speech/silence duration tracking
     - Event emission for state transitions
+    
+    One instance follows one audio stream: process_chunk must not be
+    called concurrently on the same instance (chunks are sequential).
     """
     
     def __init__(self):
@@ -37,8 +219,11 @@ class VADProcessor:
         
         # State tracking
         self.current_state = VADState.NOT_SPEAKING
-        self.speech_start_time: Optional[datetime] = None
-        self.silence_start_time: Optional[datetime] = None
+        # Start times from time.monotonic_ns() (immune to wall-clock jumps)
+        self.speech_start_time_ns: Optional[int] = None
+        self.silence_start_time_ns: Optional[int] = None
+        # Wall-clock time (time.time()) of silence start, for event payloads
+        self.silence_start_wall: Optional[float] = None
         self.consecutive_speech_chunks = 0
         self.consecutive_silence_chunks = 0
         
@@ -47,12 +232,14 @@ class VADProcessor:
         self.speech_end_threshold = 5    # chunks
         
         
-        # ONNX model
+        # ONNX model (shared, batched across sessions)
+        self._batcher = VADBatcher.instance()
         self.session: Optional[ort.InferenceSession] = None
         # Silero VAD v4+ uses a single 'state' input instead of separate h/c
         self._state = np.zeros((2, 1, 128), dtype=np.float32)
         
-        self._lock = asyncio.Lock()
+        # Set while update_state runs; guards against concurrent use
+        self._in_update = False
         
         # Load model
         self._load_model()
@@ -61,7 +248,7 @@ class VADProcessor:
         """Load Silero VAD ONNX model."""
         try:
             model_path = str(config.vad_model_path)
-            self.session = ort.InferenceSession(model_path)
+            self.session = self._batcher.load_model(model_path)
             print(f"✓ Loaded VAD model from {model_path}")
         except Exception as e:
             print(f"✗ Failed to load VAD model: {e}")
@@ -78,12 +265,14 @@ class VADProcessor:
         Returns:
             Preprocessed audio
         """
-        # Ensure float32
-        audio = audio.astype(np.float32)
+        # Ensure float32 (no copy when it already is)
+        if audio.dtype != np.float32:
+            audio = audio.astype(np.float32)
         
-        # Normalize to [-1, 1] if needed
-        if np.abs(audio).max() > 1.0:
-            audio = audio / 32768.0
+        # Normalize to [-1, 1] if needed; peak from max/min avoids
+        # materializing an abs() array
+        if max(audio.max(), -audio.min()) > 1.0:
+            audio = audio * np.float32(1.0 / 32768.0)
         
         return audio
     
@@ -107,19 +296,9 @@ class VADProcessor:
         # Ensure correct shape for model
         audio = audio.reshape(1, -1)
         
-        # Run inference
+        # Run inference (batched with other sessions, off the event loop)
         try:
-            ort_inputs = {
-                'input': audio,
-                'state': self._state,
-                'sr': np.array([self.sample_rate], dtype=np.int64)
-            }
-            
-            ort_outputs = self.session.run(None, ort_inputs)
-            probability = ort_outputs[0][0][0]
-            
-            # Update state
-            self._state = ort_outputs[1]
+            probability, self._state = await self._batcher.submit(audio, self._state)
             
             # Debug: Log VAD probability (log every 100th chunk to avoid spam)
             if hasattr(self, '_vad_log_count'):
@@ -146,7 +325,9 @@ class VADProcessor:
         Args:
             probability: Speech probability from model
         """
-        async with self._lock:
+        assert not self._in_update, "VADProcessor.process_chunk called concurrently"
+        self._in_update = True
+        try:
             is_speech = probability > self.threshold
             
             if is_speech:
@@ -161,13 +342,13 @@ class VADProcessor:
                 if self.consecutive_speech_chunks >= self.speech_start_threshold:
                     # Transition to SPEAKING
                     self.current_state = VADState.SPEAKING
-                    self.speech_start_time = datetime.now()
-                    self.silence_start_time = None
+                    self.speech_start_time_ns = time.monotonic_ns()
+                    self.silence_start_time_ns = None
                     
                     print(f"🗣️  SPEECH STARTED (prob: {probability:.3f})")
                     
                     await event_bus.emit(EventType.SPEECH_STARTED, {
-                        "timestamp": self.speech_start_time,
+                        "timestamp": time.time(),
                         "probability": probability
                     })
             
@@ -182,12 +363,13 @@ class VADProcessor:
                     if self.consecutive_silence_chunks >= self.speech_end_threshold:
                         # Transition to SILENCE_AFTER_SPEECH
                         self.current_state = VADState.SILENCE_AFTER_SPEECH
-                        self.silence_start_time = datetime.now()
+                        self.silence_start_time_ns = time.monotonic_ns()
+                        self.silence_start_wall = time.time()
                         
                         print(f"🤫 SILENCE DETECTED after {self.get_speech_duration():.0f}ms of speech")
                         
                         await event_bus.emit(EventType.SILENCE_DETECTED, {
-                            "timestamp": self.silence_start_time,
+                            "timestamp": self.silence_start_wall,
                             "speech_duration_ms": self.get_speech_duration(),
                             "probability": probability
                         })
@@ -196,11 +378,11 @@ class VADProcessor:
                 if self.consecutive_speech_chunks >= self.speech_start_threshold:
                     # User resumed speaking
                     self.current_state = VADState.SPEAKING
-                    self.speech_start_time = datetime.now()
-                    self.silence_start_time = None
+                    self.speech_start_time_ns = time.monotonic_ns()
+                    self.silence_start_time_ns = None
                     
                     await event_bus.emit(EventType.SPEECH_STARTED, {
-                        "timestamp": self.speech_start_time,
+                        "timestamp": time.time(),
                         "probability": probability,
                         "resumed": True
                     })
@@ -210,28 +392,37 @@ class VADProcessor:
                     if silence_duration >= self.min_silence_duration_ms:
                         # Emit ongoing silence (for turn detection)
                         await event_bus.emit(EventType.SILENCE_DETECTED, {
-                            "timestamp": self.silence_start_time,
+                            "timestamp": self.silence_start_wall,
                             "silence_duration_ms": silence_duration,
                             "probability": probability
                         })
+        finally:
+            self._in_update = False
     
     def get_speech_duration(self) -> float:
         """Get duration of current speech in milliseconds."""
-        if self.speech_start_time:
-            return (datetime.now() - self.speech_start_time).total_seconds() * 1000
+        if self.speech_start_time_ns is not None:
+            return (time.monotonic_ns() - self.speech_start_time_ns) / 1_000_000
         return 0.0
     
     def get_silence_duration(self) -> float:
         """Get duration of current silence in milliseconds."""
-        if self.silence_start_time:
-            return (datetime.now() - self.silence_start_time).total_seconds() * 1000
+        if self.silence_start_time_ns is not None:
+            return (time.monotonic_ns() - self.silence_start_time_ns) / 1_000_000
         return 0.0
     
+    def close(self) -> None:
+        """Stop the shared inference thread."""
+        # The batcher is a process-wide singleton: this shuts down inference
+        # for every session, so only call it on server shutdown
+        self._batcher.close()
+    
     def reset(self) -> None:
         """Reset VAD state."""
         self.current_state = VADState.NOT_SPEAKING
-        self.speech_start_time = None
-        self.silence_start_time = None
+        self.speech_start_time_ns = None
+        self.silence_start_time_ns = None
+        self.silence_start_wall = None
         self.consecutive_speech_chunks = 0
         self.consecutive_silence_chunks = 0
         
@@ -1,19 +1,76 @@
 """WebRTC connection handler."""
 import asyncio
-from typing import Optional
+import logging
+import time
+from fractions import Fraction
+from typing import Callable, Dict, Optional, Set
 import numpy as np
+import soxr
 
 from aiortc import RTCPeerConnection, RTCSessionDescription, MediaStreamTrack
-from aiortc.contrib.media import MediaRelay
+from aiortc.mediastreams import MediaStreamError
 from av import AudioFrame
 
 from .config import config
 from .audio_pipeline import AudioPipeline
+from .audio_utils import ChunkBuffer, int16_to_float32_mono
+
+logger = logging.getLogger(__name__)
+
+
+def _make_frame_converter(frame: AudioFrame) -> Callable[[AudioFrame], np.ndarray]:
+    """
+    Build a converter for a track's frames, chosen once from its first frame.
+    
+    Args:
+        frame: First decoded frame of the track (format is fixed per track)
+    
+    Returns:
+        Function mapping a frame to float32 mono samples at config.sample_rate
+    """
+    channels = len(frame.layout.channels)
+    planar = frame.format.is_planar
+    dtype = frame.to_ndarray().dtype
+    is_int16 = dtype == np.int16
+    
+    # aiortc decodes Opus at 48kHz; stream-resample to the pipeline rate
+    resampler = None
+    if frame.sample_rate != config.sample_rate:
+        resampler = soxr.ResampleStream(frame.sample_rate, config.sample_rate, 1, dtype='float32')
+    
+    def convert(frame: AudioFrame) -> np.ndarray:
+        # View as (samples, channels). Packed frames are read in place from
+        # their single interleaved plane (no to_ndarray copy); planar frames
+        # are (channels, samples)
+        if planar:
+            samples = frame.to_ndarray().T
+        else:
+            samples = np.frombuffer(
+                frame.planes[0], dtype=dtype, count=frame.samples * channels
+            ).reshape(-1, channels)
+        
+        if is_int16:
+            # float32 [-1, 1] mono in one pass
+            mono = int16_to_float32_mono(samples)
+        elif channels > 1:
+            # Float formats are already in [-1, 1]; average to mono
+            mono = samples.mean(axis=1, dtype=np.float32)
+        else:
+            mono = samples.reshape(-1).astype(np.float32, copy=False)
+        
+        if resampler is not None:
+            mono = resampler.resample_chunk(mono)
+        return mono
+    
+    return convert
 
 
 class AudioStreamTrack(MediaStreamTrack):
     """
     Custom audio track for sending audio to client.
+    
+    aiortc's sender pulls frames back to back, so recv() paces itself:
+    each frame is released at its real-time deadline (start + pts).
     """
     
     kind = "audio"
@@ -25,6 +82,33 @@ class AudioStreamTrack(MediaStreamTrack):
         
         # Frame parameters (20ms frames)
         self.samples_per_frame = int(self.sample_rate * 0.02)  # 20ms
+        self._pts = 0
+        self._time_base = Fraction(1, self.sample_rate)
+        
+        # Monotonic time of the first frame; deadlines are derived from pts
+        self._start: Optional[float] = None
+        
+        # Small ring of preallocated frames, each with an int16 view of its
+        # sample plane. The sender encodes one frame before pulling the next,
+        # so a frame is never rewritten while it is still being read.
+        self._frames = [self._make_frame() for _ in range(3)]
+        self._frame_idx = 0
+    
+    def _make_frame(self):
+        """
+        Allocate a reusable 20ms mono s16 frame.
+        
+        Returns:
+            (AudioFrame, writable int16 view of its samples)
+        """
+        frame = AudioFrame(format='s16', layout='mono', samples=self.samples_per_frame)
+        frame.sample_rate = self.sample_rate
+        frame.time_base = self._time_base
+        
+        # The plane may be padded for alignment; view just the samples
+        samples = np.frombuffer(frame.planes[0], dtype=np.int16, count=self.samples_per_frame)
+        samples[:] = 0
+        return frame, samples
     
     async def recv(self):
         """
@@ -33,30 +117,32 @@ class AudioStreamTrack(MediaStreamTrack):
         Returns:
             AudioFrame to send to client
         """
+        # Sleep until this frame is due instead of returning immediately;
+        # pulling at the deadline also picks up the freshest mixer output
+        if self._start is None:
+            self._start = time.monotonic()
+        else:
+            wait = self._start + self._pts / self.sample_rate - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        
         # Get audio from mixer
         audio = self.audio_mixer.get_output_audio(self.samples_per_frame)
         
-        if audio is None:
-            # No audio available, send silence
-            audio = np.zeros(self.samples_per_frame, dtype=np.float32)
-        
-        # Convert to int16 for transmission
-        audio_int16 = (audio * 32767).astype(np.int16)
+        frame, samples = self._frames[self._frame_idx]
+        self._frame_idx = (self._frame_idx + 1) % len(self._frames)
         
-        # Create audio frame
-        frame = AudioFrame.from_ndarray(
-            audio_int16.reshape(1, -1),  # shape: (channels, samples)
-            format='s16',
-            layout='mono'
-        )
-        frame.sample_rate = self.sample_rate
+        # Write straight into the frame (mixer output is already int16);
+        # no audio or a short read is padded with silence
+        n = 0 if audio is None else len(audio)
+        if n:
+            samples[:n] = audio
+        samples[n:] = 0
         
         # Set timestamp
-        pts = getattr(self, '_pts', 0)
-        frame.pts = pts
-        frame.time_base = f"1/{self.sample_rate}"
+        frame.pts = self._pts
         
-        self._pts = pts + self.samples_per_frame
+        self._pts += self.samples_per_frame
         
         return frame
 
@@ -85,8 +171,9 @@ class WebRTCHandler:
         # Peer connections
         self.pcs = set()
         
-        # Media relay
-        self.relay = MediaRelay()
+        # Receive tasks per peer, held so they aren't garbage collected
+        # mid-stream and can be cancelled when the peer closes
+        self._rx_tasks: Dict[RTCPeerConnection, Set[asyncio.Task]] = {}
     
     async def create_peer_connection(self) -> RTCPeerConnection:
         """
@@ -100,17 +187,20 @@ class WebRTCHandler:
         
         @pc.on("connectionstatechange")
         async def on_connectionstatechange():
-            print(f"Connection state: {pc.connectionState}")
+            logger.debug("Connection state: %s", pc.connectionState)
             if pc.connectionState == "failed" or pc.connectionState == "closed":
                 await self.close_peer_connection(pc)
         
         @pc.on("track")
         async def on_track(track):
-            print(f"Track received: {track.kind}")
+            logger.debug("Track received: %s", track.kind)
             
             if track.kind == "audio":
                 # Receive audio from client
-                asyncio.create_task(self._receive_audio(track))
+                task = asyncio.create_task(self._receive_audio(track))
+                tasks = self._rx_tasks.setdefault(pc, set())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
         
         return pc
     
@@ -122,6 +212,15 @@ class WebRTCHandler:
             track: Audio track from client
         """
         frame_count = 0
+        
+        # Frames are collected into batches of ~webrtc_rx_batch_ms so the
+        # pipeline is awaited once per batch rather than once per 20ms frame
+        batch = ChunkBuffer()
+        batch_samples = config.sample_rate * config.webrtc_rx_batch_ms // 1000
+        
+        # Picked on the first frame; the decoded format doesn't change per track
+        convert: Optional[Callable[[AudioFrame], np.ndarray]] = None
+        
         try:
             while True:
                 frame = await track.recv()
@@ -129,24 +228,27 @@ class WebRTCHandler:
                 
                 # Log every 100 frames (~2 seconds)
                 if frame_count % 100 == 0:
-                    print(f"🎧 Received {frame_count} audio frames from WebRTC")
-                
-                # Convert frame to numpy array
-                audio = frame.to_ndarray()
+                    logger.debug("Received %d audio frames from WebRTC", frame_count)
                 
-                # Convert to float32 [-1, 1]
-                if audio.dtype == np.int16:
-                    audio = audio.astype(np.float32) / 32768.0
+                # Convert frame to float32 mono at the pipeline rate
+                if convert is None:
+                    convert = _make_frame_converter(frame)
                 
-                # Flatten if multi-channel
-                if len(audio.shape) > 1:
-                    audio = audio.flatten()
+                batch.append(convert(frame))
                 
                 # Send to audio pipeline
-                await self.audio_pipeline.receive_audio(audio)
+                if len(batch) >= batch_samples:
+                    await self.audio_pipeline.receive_audio(batch.read())
+        
+        except MediaStreamError:
+            # Normal end of the client's track; pass on what was batched
+            logger.debug("Audio track ended after %d frames", frame_count)
+            if len(batch):
+                await self.audio_pipeline.receive_audio(batch.read())
         
         except Exception as e:
-            print(f"Error receiving audio: {e}")
+            # CancelledError (peer closed) is a BaseException and propagates
+            logger.error("Error receiving audio: %s", e)
     
     async def handle_offer(self, pc: RTCPeerConnection, offer: dict) -> dict:
         """
@@ -184,10 +286,19 @@ class WebRTCHandler:
         Args:
             pc: Peer connection to close
         """
-        await pc.close()
         self.pcs.discard(pc)
+        for task in self._rx_tasks.pop(pc, ()):
+            task.cancel()
+        await pc.close()
     
     async def close_all(self) -> None:
         """Close all peer connections."""
-        coros = [self.close_peer_connection(pc) for pc in list(self.pcs)]
-        await asyncio.gather(*coros)
+        # Snapshot first: each close removes itself from self.pcs. One peer
+        # failing to close must not leave the others open.
+        pcs = tuple(self.pcs)
+        results = await asyncio.gather(
+            *(self.close_peer_connection(pc) for pc in pcs), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error closing peer connection: %s", result)